@@ -12,6 +12,11 @@ from typing import Any, Dict
 
 import yaml
 
+try:  # libyaml bindings are much faster when available
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader  # type: ignore[assignment]
+
 
 REQUIRED_KEYS = ['sources', 'destination']
 
@@ -29,7 +34,7 @@ def load_config(path: Path) -> Dict[str, Any]:
         ValueError: If required keys are missing.
     """
     with path.open('r', encoding='utf-8') as f:
-        cfg = yaml.safe_load(f)
+        cfg = yaml.load(f, Loader=SafeLoader)
     missing = [key for key in REQUIRED_KEYS if key not in cfg]
     if missing:
         raise ValueError(f'Missing required configuration keys: {missing}')
@@ -2,40 +2,45 @@
 
 from __future__ import annotations
 
+import functools
 import json
+import os
 import shlex
+import time
 from datetime import datetime
 from enum import Enum
 from getpass import getpass
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
 
 import click
 from rich import box
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
+from rich.markup import escape
 from rich.panel import Panel
-from rich.prompt import Prompt
-from rich.progress import (
-    BarColumn,
-    Progress,
-    SpinnerColumn,
-    TaskProgressColumn,
-    TextColumn,
-    TimeElapsedColumn,
-)
 from rich.table import Table
 from rich.text import Text
 import yaml
 
+try:  # libyaml bindings are much faster when available
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:  # pragma: no cover
+    from yaml import SafeDumper  # type: ignore[assignment]
+
 from ..config_loader import load_config
 from ..deduplication.engine import Decision, DedupResult
-from ..discovery.engine import DiscoveredFile, discover_files
-from ..metadata.scanner import get_file_metadata
-from ..pipeline import OperationOutcome, PipelineStats, execute_pipeline
+from ..discovery.engine import DiscoveredFile, DiscoveryFilter, compile_filter, discover_files
+from ..metadata.scanner import FileMetadata
 from ..prechecks import PreflightReport, run_prechecks
 from ..remote import extract_remote_sources, sanitize_label, is_remote_target
 from .banner import BANNER_ART, BANNER_TITLE, BANNER_AUTHOR
 
+# Progress bars, prompts and the pipeline chain are imported by the commands
+# that use them so that --help, show-config and precheck start quickly.
+if TYPE_CHECKING:  # pragma: no cover
+    from ..pipeline import OperationOutcome, PipelineStats
+
 LAST_STATS: Optional[PipelineStats] = None
 LAST_RESULTS: List[DedupResult] = []
 LAST_OUTCOMES: List[OperationOutcome] = []
@@ -50,6 +55,26 @@ class Verbosity(Enum):
 CURRENT_VERBOSITY: Verbosity = Verbosity.STANDARD
 _BANNER_SHOWN = False
 
+_ACTIONABLE_DECISIONS = frozenset({Decision.COPY, Decision.REPLACE, Decision.COPY_WITH_SUFFIX})
+# Menu options that only make sense in flatten mode.
+_MIRROR_DISABLED = frozenset({'5', '7'})
+_SIZE_GETTER = attrgetter('size_bytes')
+
+# Coalesce progress bar updates: advance every N files or after this many seconds.
+_PROGRESS_BATCH = 32
+_PROGRESS_INTERVAL = 0.1
+
+# Read size used when previewing the tail of large log files.
+_TAIL_BLOCK = 4096
+
+# (path, st_mtime_ns, st_size, cfg) of the last config parsed by the menu loop.
+_CONFIG_CACHE: Optional[Tuple[Path, int, int, Dict[str, Any]]] = None
+
+
+@functools.lru_cache(maxsize=4)
+def _get_console(no_color: bool) -> Console:
+    return Console(no_color=no_color)
+
 
 def _resolve_verbosity(value: Optional[str], *, fallback: Optional[str] = None) -> Verbosity:
     if value is None and fallback is not None:
@@ -81,7 +106,35 @@ def _store_session(stats: PipelineStats, results: List[DedupResult], outcomes: L
 
 def _save_config(cfg_path: Path, cfg: dict) -> None:
     with cfg_path.open('w', encoding='utf-8') as fh:
-        yaml.safe_dump(cfg, fh, sort_keys=False)
+        yaml.dump(cfg, fh, Dumper=SafeDumper, sort_keys=False)
+    _invalidate_config_cache()
+
+
+def _load_config_cached(path: Path) -> Dict[str, Any]:
+    """Return the parsed config, re-reading YAML only when the file changed."""
+    global _CONFIG_CACHE
+    stat = path.stat()
+    cached = _CONFIG_CACHE
+    if cached and cached[0] == path and cached[1] == stat.st_mtime_ns and cached[2] == stat.st_size:
+        return cached[3]
+    cfg = load_config(path)
+    _CONFIG_CACHE = (path, stat.st_mtime_ns, stat.st_size, cfg)
+    return cfg
+
+
+def _invalidate_config_cache() -> None:
+    global _CONFIG_CACHE
+    _CONFIG_CACHE = None
+
+
+def _build_filter(cfg: Dict[str, Any]) -> DiscoveryFilter:
+    return compile_filter(
+        cfg.get('extensions'),
+        cfg.get('patterns'),
+        cfg.get('pattern_mode', 'glob'),
+        bool(cfg.get('pattern_case_sensitive', False)),
+        extension_case_sensitive=bool(cfg.get('extension_case_sensitive', False)),
+    )
 
 
 def _entry_target(entry: object) -> str:
@@ -98,6 +151,7 @@ def _entry_target(entry: object) -> str:
     return ''
 
 
+@functools.lru_cache(maxsize=4096)
 def _human_size(num_bytes: int) -> str:
     units = ['B', 'KB', 'MB', 'GB', 'TB', 'PB']
     value = float(num_bytes)
@@ -109,9 +163,16 @@ def _human_size(num_bytes: int) -> str:
 
 
 def _format_mtime(timestamp: float) -> str:
-    return datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M:%S')
+    # Only whole seconds are displayed, so truncate before hitting the cache.
+    return _format_mtime_seconds(int(timestamp))
 
 
+@functools.lru_cache(maxsize=4096)
+def _format_mtime_seconds(seconds: int) -> str:
+    return datetime.fromtimestamp(seconds).strftime('%Y-%m-%d %H:%M:%S')
+
+
+@functools.lru_cache(maxsize=4096)
 def _size_style(size_bytes: int) -> str:
     if size_bytes >= 8 * 1024**3:
         return 'bold magenta'
@@ -122,11 +183,13 @@ def _size_style(size_bytes: int) -> str:
     return 'bright_cyan'
 
 
-def _checksum_display(value: Optional[str], verbose: bool) -> str:
-    if not value:
-        return ''
-    if verbose or len(value) <= 12:
-        return value
+def _checksum_full(value: Optional[str]) -> str:
+    return value or ''
+
+
+def _checksum_short(value: Optional[str]) -> str:
+    if not value or len(value) <= 12:
+        return value or ''
     return f'{value[:8]}…{value[-4:]}'
 
 
@@ -135,7 +198,6 @@ def _build_table(verbose: bool) -> Table:
         title='Discovered files',
         box=box.SIMPLE_HEAVY,
         header_style='bold cyan',
-        highlight=True,
     )
     table.add_column('Path', overflow='fold', style='bright_white')
     table.add_column('Relative', overflow='fold', style='white')
@@ -146,7 +208,7 @@ def _build_table(verbose: bool) -> Table:
     return table
 
 
-def _render_precheck(console: Console, report: PreflightReport, title: str = 'Preflight Report') -> None:
+def _render_precheck(report: PreflightReport, title: str = 'Preflight Report') -> Panel:
     table = Table(box=box.SIMPLE, header_style='bold cyan')
     table.add_column('Status', style='bold white')
     table.add_column('Message', style='white', overflow='fold')
@@ -156,7 +218,7 @@ def _render_precheck(console: Console, report: PreflightReport, title: str = 'Pr
         table.add_row('[yellow]warning[/yellow]', message)
     for message in report.errors:
         table.add_row('[red]error[/red]', message)
-    console.print(Panel(table, title=title, border_style='bright_blue'))
+    return Panel(table, title=title, border_style='bright_blue')
 
 
 def _render_stats(console: Console, stats: PipelineStats, verbosity: Verbosity) -> None:
@@ -170,26 +232,32 @@ def _render_stats(console: Console, stats: PipelineStats, verbosity: Verbosity)
     summary = Table(box=box.SIMPLE_HEAVY, header_style='bold cyan')
     summary.add_column('Field', style='bold white')
     summary.add_column('Value', style='white', overflow='fold')
-    summary.add_row('Run ID', stats.run_id)
-    summary.add_row('Dry run', 'yes' if stats.dry_run else 'no')
-    summary.add_row('Duration', f'{stats.duration_seconds:.2f} seconds')
-    summary.add_row('Discovered files', str(stats.discovered_files))
-    summary.add_row('Metadata collected', str(stats.metadata_collected))
-    summary.add_row('Errors', str(stats.errors))
-    summary.add_row('CSV log', str(stats.csv_log))
-    summary.add_row('JSON log', str(stats.json_log))
-    console.print(Panel(summary, title='Pipeline Summary', border_style='bright_green'))
+    summary_rows = [
+        ('Run ID', stats.run_id),
+        ('Dry run', 'yes' if stats.dry_run else 'no'),
+        ('Duration', f'{stats.duration_seconds:.2f} seconds'),
+        ('Discovered files', f'{stats.discovered_files}'),
+        ('Metadata collected', f'{stats.metadata_collected}'),
+        ('Errors', f'{stats.errors}'),
+        ('CSV log', f'{stats.csv_log}'),
+        ('JSON log', f'{stats.json_log}'),
+    ]
+    for field, value in summary_rows:
+        summary.add_row(field, value)
 
     counts_table = Table(box=box.SIMPLE, header_style='bold cyan')
     counts_table.add_column('Decision')
     counts_table.add_column('Count', justify='right')
-    for decision, count in sorted(stats.decision_counts.items()):
-        counts_table.add_row(decision, str(count))
-    console.print(counts_table)
+    for decision, count in stats.decision_counts.most_common():
+        counts_table.add_row(decision, f'{count}')
 
-    if verbosity != Verbosity.MAXIMAL and not (stats.report.warnings or stats.report.errors):
-        return
-    _render_precheck(console, stats.report, title='Preflight Recap')
+    blocks: List[RenderableType] = [
+        Panel(summary, title='Pipeline Summary', border_style='bright_green'),
+        counts_table,
+    ]
+    if verbosity == Verbosity.MAXIMAL or stats.report.warnings or stats.report.errors:
+        blocks.append(_render_precheck(stats.report, title='Preflight Recap'))
+    console.print(Group(*blocks))
 
 
 def _render_decisions(console: Console, results: List[DedupResult], limit: int = 15, *, verbosity: Verbosity) -> None:
@@ -199,8 +267,18 @@ def _render_decisions(console: Console, results: List[DedupResult], limit: int =
         console.print('[yellow]No deduplication results to display.[/yellow]')
         return
     limit = len(results) if verbosity == Verbosity.MAXIMAL else limit
-    actionable = [r for r in results if r.decision in {Decision.COPY, Decision.REPLACE, Decision.COPY_WITH_SUFFIX}]
-    duplicates = [r for r in results if r.decision == Decision.DUPLICATE]
+    actionable: List[DedupResult] = []
+    duplicates: List[DedupResult] = []
+    for r in results:
+        if r.decision in _ACTIONABLE_DECISIONS:
+            actionable.append(r)
+        elif r.decision is Decision.DUPLICATE:
+            duplicates.append(r)
+        else:
+            continue
+        # Only the first ``limit`` rows of each table are shown.
+        if len(actionable) >= limit and len(duplicates) >= limit:
+            break
 
     table = Table(title='Planned Transfers', box=box.SIMPLE_HEAVY, header_style='bold cyan')
     table.add_column('Decision', style='green')
@@ -216,9 +294,7 @@ def _render_decisions(console: Console, results: List[DedupResult], limit: int =
         dup_table.add_column('Source', overflow='fold', style='bright_white')
         dup_table.add_column('Reason', style='yellow')
         for entry in duplicates[:limit]:
-            detail = entry.reason
-            if entry.duplicate_action != 'skip':
-                detail += f' ({entry.duplicate_action})'
+            detail = entry.reason if entry.duplicate_action == 'skip' else f'{entry.reason} ({entry.duplicate_action})'
             dup_table.add_row(str(entry.src.path), detail)
         console.print(dup_table)
 
@@ -245,6 +321,21 @@ def _render_failures(console: Console, outcomes: List[OperationOutcome], *, verb
     console.print(table)
 
 
+def _tail_lines(path: Path, n: int = 20, block: int = _TAIL_BLOCK) -> List[str]:
+    """Return the last ``n`` lines of ``path`` without reading the whole file."""
+    with path.open('rb') as fh:
+        fh.seek(0, os.SEEK_END)
+        position = fh.tell()
+        data = b''
+        # One extra newline guarantees the first retained line is complete.
+        while position > 0 and data.count(b'\n') <= n:
+            step = min(block, position)
+            position -= step
+            fh.seek(position)
+            data = fh.read(step) + data
+    return data.decode('utf-8', errors='replace').splitlines()[-n:]
+
+
 def _show_logs(console: Console) -> None:
     if not LAST_STATS:
         console.print('[yellow]No pipeline run recorded yet.[/yellow]')
@@ -254,9 +345,12 @@ def _show_logs(console: Console) -> None:
             console.print(f'[yellow]Log file not found:[/yellow] {path}')
             continue
         console.print(Panel.fit(f'{path.name}\n{path}', border_style='bright_blue'))
-        content = path.read_text(encoding='utf-8')
-        lines = content.splitlines()
-        preview = '\n'.join(lines[-20:]) if len(lines) > 20 else content
+        if path.stat().st_size <= _TAIL_BLOCK:
+            content = path.read_text(encoding='utf-8')
+            lines = content.splitlines()
+            preview = '\n'.join(lines[-20:]) if len(lines) > 20 else content
+        else:
+            preview = '\n'.join(_tail_lines(path, 20))
         console.print(preview or '[dim]Log file is empty.[/dim]')
 
 
@@ -283,6 +377,23 @@ def _show_retry_queue(console: Console) -> None:
 
 
 def _remote_sources_menu(console: Console, cfg_path: Path) -> None:
+    from rich.prompt import Prompt
+
+    options = {
+        '1': 'Add remote source',
+        '2': 'Remove remote source',
+        '3': 'Set staging directory',
+        '4': 'Set default rsync args',
+        '5': 'Set remote parallel workers',
+        '0': 'Back',
+    }
+    choices = list(options)
+    opt_table = Table(box=box.SIMPLE, header_style='bold cyan')
+    opt_table.add_column('Option', justify='right', style='bold white')
+    opt_table.add_column('Description', style='white')
+    for key, desc in options.items():
+        opt_table.add_row(key, desc)
+
     while True:
         cfg = load_config(cfg_path)
         remote_entries = list(cfg.get('remote_sources', []))
@@ -336,22 +447,9 @@ def _remote_sources_menu(console: Console, cfg_path: Path) -> None:
                 console.print(f'  - {src}')
             console.print('[dim]Remove inline entries or re-add them via this menu for full management.[/dim]')
 
-        options = {
-            '1': 'Add remote source',
-            '2': 'Remove remote source',
-            '3': 'Set staging directory',
-            '4': 'Set default rsync args',
-            '5': 'Set remote parallel workers',
-            '0': 'Back',
-        }
-        opt_table = Table(box=box.SIMPLE, header_style='bold cyan')
-        opt_table.add_column('Option', justify='right', style='bold white')
-        opt_table.add_column('Description', style='white')
-        for key, desc in options.items():
-            opt_table.add_row(key, desc)
         console.print(opt_table)
 
-        choice = Prompt.ask('Select option', choices=list(options.keys()), default='0')
+        choice = Prompt.ask('Select option', choices=choices, default='0')
         if choice == '0':
             break
         if choice == '1':
@@ -446,6 +544,149 @@ def _remote_sources_menu(console: Console, cfg_path: Path) -> None:
         console.print()
 
 
+def _interactive_config_menu(console: Console, cfg_path: Path) -> None:
+    from rich.prompt import Prompt
+
+    cfg = load_config(cfg_path)
+    options: Dict[str, str] = {
+        '1': 'Add source path',
+        '2': 'Remove source path',
+        '3': 'Set destination',
+        '4': 'Set operation mode',
+        '5': 'Configure duplicate handling',
+        '6': 'Edit file patterns',
+        '7': 'Set verbosity',
+        '8': 'Toggle dry-run default',
+        '9': 'Manage remote sources',
+        '0': 'Back to main menu',
+    }
+    choices = list(options)
+    opt_table = Table(box=box.SIMPLE, header_style='bold cyan')
+    opt_table.add_column('Option', justify='right', style='bold white')
+    opt_table.add_column('Description', style='white')
+    for key, desc in options.items():
+        opt_table.add_row(key, desc)
+
+    while True:
+        overview = Table(title='Configuration Editor', box=box.SIMPLE_HEAVY, header_style='bold cyan')
+        overview.add_column('Key', style='bold white')
+        overview.add_column('Value', style='white', overflow='fold')
+        overview.add_row('Sources', ', '.join(cfg.get('sources', [])))
+        overview.add_row('Destination', str(cfg.get('destination')))
+        overview.add_row('Patterns', ', '.join(cfg.get('patterns', []) or ['<none>']))
+        overview.add_row('Extensions', ', '.join(cfg.get('extensions', []) or ['<none>']))
+        overview.add_row('Operation mode', cfg.get('operation_mode', 'flatten'))
+        overview.add_row('Duplicates policy', cfg.get('duplicates_policy', 'skip'))
+        overview.add_row('Duplicates archive dir', str(cfg.get('duplicates_archive_dir', '<unset>')))
+        remote_count = len(cfg.get('remote_sources', []))
+        overview.add_row('Remote sources', str(remote_count))
+        overview.add_row('Remote staging dir', str(cfg.get('remote_staging_dir', './data/remote_staging')))
+        overview.add_row('Verbosity', cfg.get('verbosity', 'standard'))
+        overview.add_row('Dry run', str(cfg.get('dry_run', True)))
+        console.print(overview)
+
+        console.print(opt_table)
+
+        choice = Prompt.ask('Select option', choices=choices, default='0')
+        if choice == '0':
+            return
+        if choice == '1':
+            new_source = Prompt.ask('Enter new source path')
+            if new_source:
+                path = Path(new_source).expanduser()
+                path.mkdir(parents=True, exist_ok=True)
+                sources = list(cfg.get('sources', []))
+                if new_source not in sources:
+                    sources.append(new_source)
+                    cfg['sources'] = sources
+                    _save_config(cfg_path, cfg)
+                    console.print('[green]Source added.[/green]')
+                else:
+                    console.print('[yellow]Source already present.[/yellow]')
+            continue
+        if choice == '2':
+            sources = list(cfg.get('sources', []))
+            if not sources:
+                console.print('[yellow]No sources to remove.[/yellow]')
+                continue
+            for idx, src in enumerate(sources, start=1):
+                console.print(f'{idx}) {src}')
+            selection = Prompt.ask('Enter number to remove (0 to cancel)', default='0')
+            if selection.isdigit():
+                idx = int(selection)
+                if 1 <= idx <= len(sources):
+                    removed = sources.pop(idx - 1)
+                    cfg['sources'] = sources
+                    _save_config(cfg_path, cfg)
+                    console.print(f'[red]Removed[/red] {removed}')
+                else:
+                    console.print('[yellow]Selection out of range.[/yellow]')
+            else:
+                console.print('[yellow]Invalid selection.[/yellow]')
+            continue
+        if choice == '3':
+            destination = Prompt.ask('Destination path', default=str(cfg.get('destination')))
+            if destination:
+                dest_path = Path(destination).expanduser()
+                dest_path.mkdir(parents=True, exist_ok=True)
+                cfg['destination'] = destination
+                _save_config(cfg_path, cfg)
+                console.print('[green]Destination updated.[/green]')
+            continue
+        if choice == '4':
+            mode = Prompt.ask('Operation mode', choices=['flatten', 'mirror'], default=cfg.get('operation_mode', 'flatten'))
+            cfg['operation_mode'] = mode
+            if mode == 'mirror':
+                prefix = Prompt.ask(
+                    'Prefix preserved structure with source root name?',
+                    choices=['yes', 'no'],
+                    default='yes' if cfg.get('mirror_prefix_with_root', True) else 'no',
+                )
+                cfg['mirror_prefix_with_root'] = prefix == 'yes'
+            _save_config(cfg_path, cfg)
+            console.print('[green]Operation mode updated.[/green]')
+            continue
+        if choice == '5':
+            policy = Prompt.ask('Duplicates policy', choices=['skip', 'archive', 'delete'], default=cfg.get('duplicates_policy', 'skip'))
+            cfg['duplicates_policy'] = policy
+            if policy == 'archive':
+                archive_dir = Prompt.ask('Archive duplicates to directory', default=str(cfg.get('duplicates_archive_dir', './logs/duplicates')))
+                Path(archive_dir).expanduser().mkdir(parents=True, exist_ok=True)
+                cfg['duplicates_archive_dir'] = archive_dir
+            else:
+                cfg.pop('duplicates_archive_dir', None)
+            _save_config(cfg_path, cfg)
+            console.print('[green]Duplicate handling updated.[/green]')
+            continue
+        if choice == '6':
+            current = ','.join(cfg.get('patterns', []) or [])
+            response = Prompt.ask('Enter comma-separated patterns (empty to clear)', default=current)
+            if response.strip():
+                patterns = [item.strip() for item in response.split(',') if item.strip()]
+                cfg['patterns'] = patterns
+            else:
+                cfg.pop('patterns', None)
+            _save_config(cfg_path, cfg)
+            console.print('[green]Patterns updated.[/green]')
+            continue
+        if choice == '7':
+            verbosity = Prompt.ask('Verbosity', choices=[v.value for v in Verbosity], default=cfg.get('verbosity', 'standard'))
+            cfg['verbosity'] = verbosity
+            _save_config(cfg_path, cfg)
+            console.print('[green]Verbosity updated.[/green]')
+            continue
+        if choice == '8':
+            cfg['dry_run'] = not cfg.get('dry_run', True)
+            _save_config(cfg_path, cfg)
+            console.print(f"[cyan]dry_run set to[/cyan] {cfg['dry_run']}")
+            continue
+        if choice == '9':
+            _remote_sources_menu(console, cfg_path)
+            cfg = load_config(cfg_path)
+            continue
+        console.print('[yellow]Unknown option.[/yellow]')
+
+
 @click.group()
 def cli() -> None:
     """FileOps Toolkit CLI."""
@@ -458,7 +699,18 @@ def cli() -> None:
 @click.option('--no-color', is_flag=True, default=False, help='Disable coloured output.')
 def scan(config_path: str, verbose: bool, verbosity_option: Optional[str], no_color: bool) -> None:
     """Scan configured sources and display discovered files."""
-    console = Console(no_color=no_color)
+    from rich.progress import (
+        BarColumn,
+        Progress,
+        SpinnerColumn,
+        TaskProgressColumn,
+        TextColumn,
+        TimeElapsedColumn,
+    )
+
+    from ..pipeline import collect_metadata
+
+    console = _get_console(no_color)
     cfg = load_config(Path(config_path))
     _maybe_show_banner(console)
     global CURRENT_VERBOSITY
@@ -472,27 +724,21 @@ def scan(config_path: str, verbose: bool, verbosity_option: Optional[str], no_co
     if not sources:
         console.print('[bold yellow]No local sources configured to scan.[/bold yellow]')
         return
-    extensions = cfg.get('extensions')
     checksum_algo = cfg.get('checksum_algo')
     patterns = cfg.get('patterns')
-    pattern_mode = cfg.get('pattern_mode', 'glob')
-    case_sensitive = bool(cfg.get('pattern_case_sensitive', False))
 
     discovered = list(
         discover_files(
             sources,
-            extensions,
-            patterns=patterns,
-            pattern_mode=pattern_mode,
-            case_sensitive=case_sensitive,
+            compiled_filter=_build_filter(cfg),
+            follow_symlinks=bool(cfg.get('follow_symlinks', False)),
         )
     )
     if not discovered:
         console.print('[bold yellow]No matching files were found.[/bold yellow]')
         return
 
-    table = _build_table(verbosity == Verbosity.MAXIMAL)
-    metadata = []
+    metadata: List[FileMetadata] = []
     progress_columns = (
         SpinnerColumn(),
         TextColumn('[progress.description]{task.description}'),
@@ -504,36 +750,56 @@ def scan(config_path: str, verbose: bool, verbosity_option: Optional[str], no_co
         task_id: Optional[int] = None
         if verbosity != Verbosity.MINIMAL:
             task_id = progress.add_task('Collecting metadata', total=len(discovered))
-        for item in discovered:
-            meta = get_file_metadata(
-                item.path,
-                checksum_algo,
-                source_root=item.root,
-                relative_path=item.relative_path,
-            )
+        pending = 0
+        last_update = time.monotonic()
+        # Same worker pool and checksum cache handling as ``run``; results arrive in discovery order.
+        for meta in collect_metadata(discovered, cfg):
             metadata.append(meta)
-            if verbosity != Verbosity.MINIMAL and task_id is not None:
-                path_text = Text(str(meta.path), style='bright_white')
-                relative_text = Text(str(meta.relative_path or ''), style='white')
-                size_text = Text(_human_size(meta.size_bytes), style=_size_style(meta.size_bytes))
-                mtime_text = Text(_format_mtime(meta.mtime), style='green')
-                checksum_text = Text(_checksum_display(meta.checksum, verbosity == Verbosity.MAXIMAL), style='yellow')
-                table.add_row(path_text, relative_text, size_text, mtime_text, checksum_text)
-                progress.advance(task_id)
+            if task_id is None:
+                continue
+            pending += 1
+            if pending >= _PROGRESS_BATCH or time.monotonic() - last_update > _PROGRESS_INTERVAL:
+                progress.advance(task_id, pending)
+                pending = 0
+                last_update = time.monotonic()
+        if task_id is not None and pending:
+            progress.advance(task_id, pending)
 
     if verbosity != Verbosity.MINIMAL:
+        # Build the table once metadata collection is done; column styles cover
+        # everything except the size cell, which is coloured by magnitude.
+        table = _build_table(verbosity == Verbosity.MAXIMAL)
+        verbose = verbosity == Verbosity.MAXIMAL
+        checksum_fmt = _checksum_full if verbose else _checksum_short
+        # Styling is discarded when output is redirected, so skip building Text objects.
+        styled = console.is_terminal and not no_color
+        for meta in metadata:
+            if styled:
+                table.add_row(
+                    Text(str(meta.path)),
+                    Text(str(meta.relative_path or '')),
+                    Text(_human_size(meta.size_bytes), style=_size_style(meta.size_bytes)),
+                    _format_mtime(meta.mtime),
+                    checksum_fmt(meta.checksum),
+                )
+            else:
+                table.add_row(
+                    escape(str(meta.path)),
+                    escape(str(meta.relative_path or '')),
+                    _human_size(meta.size_bytes),
+                    _format_mtime(meta.mtime),
+                    checksum_fmt(meta.checksum),
+                )
         console.print(table)
-    total_size = sum(item.size_bytes for item in metadata)
-    summary = Text()
-    summary.append('Sources: ', style='bold cyan')
-    summary.append(', '.join(sources) + '\n')
-    summary.append('Patterns: ', style='bold cyan')
-    summary.append(', '.join(patterns or ['<none>']) + '\n')
-    summary.append('Files: ', style='bold green')
-    summary.append(f'{len(metadata)}\n')
-    summary.append('Total size: ', style='bold magenta')
-    summary.append(_human_size(total_size))
-    console.print(Panel(summary, title='Scan summary', border_style='bright_blue'))
+    total_size = sum(map(_SIZE_GETTER, metadata))
+    # Sources and glob patterns may contain brackets, so escape them before markup parsing.
+    body = (
+        f'[bold cyan]Sources:[/] {escape(", ".join(sources))}\n'
+        f'[bold cyan]Patterns:[/] {escape(", ".join(patterns or ["<none>"]))}\n'
+        f'[bold green]Files:[/] {len(metadata)}\n'
+        f'[bold magenta]Total size:[/] {_human_size(total_size)}'
+    )
+    console.print(Panel(Text.from_markup(body), title='Scan summary', border_style='bright_blue'))
     if verbosity != Verbosity.MINIMAL:
         algo = checksum_algo or '<disabled>'
         console.print(f'[dim]Checksum algorithm(s): {algo}[/dim]')
@@ -545,14 +811,14 @@ def scan(config_path: str, verbose: bool, verbosity_option: Optional[str], no_co
 @click.option('--no-color', is_flag=True, default=False, help='Disable coloured output.')
 def precheck(config_path: str, no_color: bool) -> None:
     """Run environment pre-checks."""
-    console = Console(no_color=no_color)
+    console = _get_console(no_color)
     cfg = load_config(Path(config_path))
     _maybe_show_banner(console)
     local_sources, remote_sources = extract_remote_sources(cfg)
     precheck_cfg = dict(cfg)
     precheck_cfg['sources'] = local_sources
     report = run_prechecks(precheck_cfg, remote_sources=remote_sources)
-    _render_precheck(console, report)
+    console.print(_render_precheck(report))
     if report.errors:
         raise click.ClickException('Prechecks reported blocking issues.')
 
@@ -577,6 +843,8 @@ def run(
     no_color: bool,
 ) -> None:
     """Execute the full pipeline."""
+    from ..pipeline import execute_pipeline
+
     if apply and force_dry_run:
         raise click.BadParameter('Cannot use --apply and --dry-run together.')
     dry_override: Optional[bool] = None
@@ -585,7 +853,7 @@ def run(
     elif force_dry_run:
         dry_override = True
 
-    console = Console(no_color=no_color)
+    console = _get_console(no_color)
     cfg = load_config(Path(config_path))
     _maybe_show_banner(console)
     global CURRENT_VERBOSITY
@@ -607,7 +875,7 @@ def run(
 def show_config(config_path: str, no_color: bool) -> None:
     """Print the current configuration."""
     cfg = load_config(Path(config_path))
-    console = Console(no_color=no_color)
+    console = _get_console(no_color)
     _maybe_show_banner(console)
     console.print_json(json.dumps(cfg, indent=2))
 
@@ -617,7 +885,11 @@ def show_config(config_path: str, no_color: bool) -> None:
 @click.option('--no-color', is_flag=True, default=False)
 def menu(config_path: str, no_color: bool) -> None:
     """Interactive management menu."""
-    console = Console(no_color=no_color)
+    from rich.prompt import Prompt
+
+    from ..pipeline import execute_pipeline
+
+    console = _get_console(no_color)
     _maybe_show_banner(console)
     cfg_path = Path(config_path)
     global CURRENT_VERBOSITY
@@ -633,11 +905,10 @@ def menu(config_path: str, no_color: bool) -> None:
         '9': 'Stop / Resume operations',
         '0': 'Exit',
     }
+    menu_choices = list(menu_options)
 
     def _print_menu(cfg: dict) -> None:
-        disabled = set()
-        if cfg.get('operation_mode', 'flatten') == 'mirror':
-            disabled.update({'5', '7'})
+        disabled = _MIRROR_DISABLED if cfg.get('operation_mode', 'flatten') == 'mirror' else frozenset()
         table = Table(title='FileOps Toolkit Menu', box=box.SIMPLE_HEAVY, header_style='bold cyan')
         table.add_column('Option', justify='right', style='bold white')
         table.add_column('Description', style='white')
@@ -650,15 +921,15 @@ def menu(config_path: str, no_color: bool) -> None:
         console.print(table)
 
     while True:
-        cfg = load_config(cfg_path)
+        cfg = _load_config_cached(cfg_path)
         if CURRENT_VERBOSITY is None:
             CURRENT_VERBOSITY = _resolve_verbosity(None, fallback=cfg.get('verbosity'))
         _print_menu(cfg)
-        choice = Prompt.ask('Select option', choices=list(menu_options.keys()), default='0')
+        choice = Prompt.ask('Select option', choices=menu_choices, default='0')
         if choice == '0':
             console.print('[green]Goodbye![/green]')
             break
-        if cfg.get('operation_mode', 'flatten') == 'mirror' and choice in {'5', '7'}:
+        if cfg.get('operation_mode', 'flatten') == 'mirror' and choice in _MIRROR_DISABLED:
             console.print('[yellow]Option unavailable in mirror mode.[/yellow]')
             console.print()
             continue
@@ -674,7 +945,8 @@ def menu(config_path: str, no_color: bool) -> None:
             _render_decisions(console, results, limit=25, verbosity=CURRENT_VERBOSITY)
         elif choice == '3':
             _interactive_config_menu(console, cfg_path)
-            cfg = load_config(cfg_path)
+            _invalidate_config_cache()
+            cfg = _load_config_cached(cfg_path)
             CURRENT_VERBOSITY = _resolve_verbosity(None, fallback=cfg.get('verbosity'))
         elif choice == '4':
             if LAST_STATS:
@@ -699,141 +971,3 @@ def menu(config_path: str, no_color: bool) -> None:
 
 if __name__ == '__main__':  # pragma: no cover
     cli()
-def _interactive_config_menu(console: Console, cfg_path: Path) -> None:
-    cfg = load_config(cfg_path)
-
-    while True:
-        overview = Table(title='Configuration Editor', box=box.SIMPLE_HEAVY, header_style='bold cyan')
-        overview.add_column('Key', style='bold white')
-        overview.add_column('Value', style='white', overflow='fold')
-        overview.add_row('Sources', ', '.join(cfg.get('sources', [])))
-        overview.add_row('Destination', str(cfg.get('destination')))
-        overview.add_row('Patterns', ', '.join(cfg.get('patterns', []) or ['<none>']))
-        overview.add_row('Extensions', ', '.join(cfg.get('extensions', []) or ['<none>']))
-        overview.add_row('Operation mode', cfg.get('operation_mode', 'flatten'))
-        overview.add_row('Duplicates policy', cfg.get('duplicates_policy', 'skip'))
-        overview.add_row('Duplicates archive dir', str(cfg.get('duplicates_archive_dir', '<unset>')))
-        remote_count = len(cfg.get('remote_sources', []))
-        overview.add_row('Remote sources', str(remote_count))
-        overview.add_row('Remote staging dir', str(cfg.get('remote_staging_dir', './data/remote_staging')))
-        overview.add_row('Verbosity', cfg.get('verbosity', 'standard'))
-        overview.add_row('Dry run', str(cfg.get('dry_run', True)))
-        console.print(overview)
-
-        options: Dict[str, str] = {
-            '1': 'Add source path',
-            '2': 'Remove source path',
-            '3': 'Set destination',
-            '4': 'Set operation mode',
-            '5': 'Configure duplicate handling',
-            '6': 'Edit file patterns',
-            '7': 'Set verbosity',
-            '8': 'Toggle dry-run default',
-            '9': 'Manage remote sources',
-            '0': 'Back to main menu',
-        }
-        opt_table = Table(box=box.SIMPLE, header_style='bold cyan')
-        opt_table.add_column('Option', justify='right', style='bold white')
-        opt_table.add_column('Description', style='white')
-        for key, desc in options.items():
-            opt_table.add_row(key, desc)
-        console.print(opt_table)
-
-        choice = Prompt.ask('Select option', choices=list(options.keys()), default='0')
-        if choice == '0':
-            return
-        if choice == '1':
-            new_source = Prompt.ask('Enter new source path')
-            if new_source:
-                path = Path(new_source).expanduser()
-                path.mkdir(parents=True, exist_ok=True)
-                sources = list(cfg.get('sources', []))
-                if new_source not in sources:
-                    sources.append(new_source)
-                    cfg['sources'] = sources
-                    _save_config(cfg_path, cfg)
-                    console.print('[green]Source added.[/green]')
-                else:
-                    console.print('[yellow]Source already present.[/yellow]')
-            continue
-        if choice == '2':
-            sources = list(cfg.get('sources', []))
-            if not sources:
-                console.print('[yellow]No sources to remove.[/yellow]')
-                continue
-            for idx, src in enumerate(sources, start=1):
-                console.print(f'{idx}) {src}')
-            selection = Prompt.ask('Enter number to remove (0 to cancel)', default='0')
-            if selection.isdigit():
-                idx = int(selection)
-                if 1 <= idx <= len(sources):
-                    removed = sources.pop(idx - 1)
-                    cfg['sources'] = sources
-                    _save_config(cfg_path, cfg)
-                    console.print(f'[red]Removed[/red] {removed}')
-                else:
-                    console.print('[yellow]Selection out of range.[/yellow]')
-            else:
-                console.print('[yellow]Invalid selection.[/yellow]')
-            continue
-        if choice == '3':
-            destination = Prompt.ask('Destination path', default=str(cfg.get('destination')))
-            if destination:
-                dest_path = Path(destination).expanduser()
-                dest_path.mkdir(parents=True, exist_ok=True)
-                cfg['destination'] = destination
-                _save_config(cfg_path, cfg)
-                console.print('[green]Destination updated.[/green]')
-            continue
-        if choice == '4':
-            mode = Prompt.ask('Operation mode', choices=['flatten', 'mirror'], default=cfg.get('operation_mode', 'flatten'))
-            cfg['operation_mode'] = mode
-            if mode == 'mirror':
-                prefix = Prompt.ask(
-                    'Prefix preserved structure with source root name?',
-                    choices=['yes', 'no'],
-                    default='yes' if cfg.get('mirror_prefix_with_root', True) else 'no',
-                )
-                cfg['mirror_prefix_with_root'] = prefix == 'yes'
-            _save_config(cfg_path, cfg)
-            console.print('[green]Operation mode updated.[/green]')
-            continue
-        if choice == '5':
-            policy = Prompt.ask('Duplicates policy', choices=['skip', 'archive', 'delete'], default=cfg.get('duplicates_policy', 'skip'))
-            cfg['duplicates_policy'] = policy
-            if policy == 'archive':
-                archive_dir = Prompt.ask('Archive duplicates to directory', default=str(cfg.get('duplicates_archive_dir', './logs/duplicates')))
-                Path(archive_dir).expanduser().mkdir(parents=True, exist_ok=True)
-                cfg['duplicates_archive_dir'] = archive_dir
-            else:
-                cfg.pop('duplicates_archive_dir', None)
-            _save_config(cfg_path, cfg)
-            console.print('[green]Duplicate handling updated.[/green]')
-            continue
-        if choice == '6':
-            current = ','.join(cfg.get('patterns', []) or [])
-            response = Prompt.ask('Enter comma-separated patterns (empty to clear)', default=current)
-            if response.strip():
-                patterns = [item.strip() for item in response.split(',') if item.strip()]
-                cfg['patterns'] = patterns
-            else:
-                cfg.pop('patterns', None)
-            _save_config(cfg_path, cfg)
-            console.print('[green]Patterns updated.[/green]')
-            continue
-        if choice == '7':
-            verbosity = Prompt.ask('Verbosity', choices=[v.value for v in Verbosity], default=cfg.get('verbosity', 'standard'))
-            cfg['verbosity'] = verbosity
-            _save_config(cfg_path, cfg)
-            console.print('[green]Verbosity updated.[/green]')
-            continue
-        if choice == '8':
-            cfg['dry_run'] = not cfg.get('dry_run', True)
-            _save_config(cfg_path, cfg)
-            console.print(f"[cyan]dry_run set to[/cyan] {cfg['dry_run']}")
-            continue
-        if choice == '9':
-            _remote_sources_menu(console, cfg_path)
-            cfg = load_config(cfg_path)
-            continue
-        console.print('[yellow]Unknown option.[/yellow]')
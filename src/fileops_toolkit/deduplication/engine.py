@@ -8,11 +8,14 @@ and returns a list of decisions.
 
 from __future__ import annotations
 
+import os
+from collections import Counter, defaultdict
 from dataclasses import dataclass
 from enum import Enum, auto
-from itertools import count
+from itertools import count, islice
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import AbstractSet, DefaultDict, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
 
 from ..metadata.scanner import FileMetadata, get_file_metadata
 
@@ -26,6 +29,11 @@ class Decision(Enum):
     ERROR = auto()
 
 
+_TRANSFER_DECISIONS = frozenset({Decision.COPY, Decision.REPLACE, Decision.COPY_WITH_SUFFIX})
+# Largest, then newest, wins within a name group.
+_RANK_KEY = attrgetter('size_bytes', 'mtime')
+
+
 @dataclass
 class DedupResult:
     src: FileMetadata
@@ -71,9 +79,49 @@ def _duplicate_reason(candidate: FileMetadata, winner: FileMetadata) -> str:
     return 'policy_prefer_newer'
 
 
-def _unique_dest_path(base_dir: Path, filename: str, used: Dict[Path, int]) -> Tuple[Path, Optional[str]]:
+# The destination is pre-scanned only while it is small next to the plan: reading
+# a large archive to place a handful of files costs far more than one stat per name.
+_DEST_SCAN_MIN = 256
+_DEST_SCAN_PER_NAME = 4
+
+
+def _scan_destination(destination: Path, planned_names: int) -> Optional[FrozenSet[str]]:
+    """Casefolded names in ``destination``, or ``None`` if it is too large to be worth scanning.
+
+    At most ``max(_DEST_SCAN_MIN, planned_names * _DEST_SCAN_PER_NAME)``
+    entries are read. Names are casefolded so the set never rules out a file
+    that a case-insensitive filesystem would resolve; hits are confirmed with
+    a real ``exists()`` call.
+    """
+    limit = max(_DEST_SCAN_MIN, planned_names * _DEST_SCAN_PER_NAME)
+    try:
+        with os.scandir(destination) as entries:
+            names = [entry.name.casefold() for entry in islice(entries, limit + 1)]
+    except FileNotFoundError:
+        return frozenset()
+    except OSError:
+        return None
+    if len(names) > limit:
+        return None
+    return frozenset(names)
+
+
+def _dest_exists(path: Path, dest_names: Optional[AbstractSet[str]]) -> bool:
+    # Names missing from the scan can't exist; hits still need a real check
+    # (broken symlinks are listed but don't exist). Without a scan, stat every name.
+    if dest_names is not None and path.name.casefold() not in dest_names:
+        return False
+    return path.exists()
+
+
+def _unique_dest_path(
+    base_dir: Path,
+    filename: str,
+    used: Dict[Path, int],
+    dest_names: Optional[AbstractSet[str]],
+) -> Tuple[Path, Optional[str]]:
     path = base_dir / filename
-    if path not in used and not path.exists():
+    if path not in used and not _dest_exists(path, dest_names):
         used[path] = 0
         return path, None
     stem = Path(filename).stem
@@ -81,7 +129,7 @@ def _unique_dest_path(base_dir: Path, filename: str, used: Dict[Path, int]) -> T
     counter = used.get(path, 0) + 1
     while True:
         candidate = base_dir / f'{stem}_{counter}{ext}'
-        if candidate not in used and not candidate.exists():
+        if candidate not in used and not _dest_exists(candidate, dest_names):
             used[path] = counter
             used[candidate] = 0
             return candidate, f'_{counter}'
@@ -92,7 +140,11 @@ def _load_destination_metadata(
     dest_path: Path,
     preferred_algos: Sequence[str],
     cache: Dict[Path, Optional[FileMetadata]],
+    dest_names: Optional[AbstractSet[str]],
 ) -> Optional[FileMetadata]:
+    # Names absent from the destination scan skip the Path-keyed cache (and its hashing) entirely.
+    if dest_names is not None and dest_path.name.casefold() not in dest_names:
+        return None
     if dest_path in cache:
         return cache[dest_path]
     if not dest_path.exists():
@@ -114,6 +166,25 @@ def _build_backup_path(dest_path: Path, backup_dir: Path) -> Path:
             return candidate
 
 
+def _flag_near_duplicates(results: List[DedupResult], min_ratio: float) -> List[DedupResult]:
+    """Note transfers whose content chunks largely overlap an earlier planned transfer."""
+    owners: Dict[bytes, int] = {}
+    for idx, result in enumerate(results):
+        chunks = result.src.chunks
+        if not result.should_transfer or not chunks:
+            continue
+        unique = set(chunks)
+        shared = Counter(owners[chunk] for chunk in unique if chunk in owners)
+        if shared and result.message is None:
+            owner, shared_count = shared.most_common(1)[0]
+            ratio = shared_count / len(unique)
+            if ratio >= min_ratio:
+                result.message = f'near_duplicate_of:{results[owner].src.path} ({ratio:.0%} shared chunks)'
+        for chunk in unique:
+            owners.setdefault(chunk, idx)
+    return results
+
+
 def deduplicate(
     files: Iterable[FileMetadata],
     destination: Path,
@@ -125,6 +196,7 @@ def deduplicate(
     duplicate_action: str = 'skip',
     duplicate_archive_dir: Optional[Path] = None,
     mirror_prefix_with_root: bool = True,
+    near_duplicate_ratio: float = 0.0,
 ) -> List[DedupResult]:
     """Plan deduplication operations for discovered files.
 
@@ -134,6 +206,9 @@ def deduplicate(
         policy: Deduplication policy (``prefer_newer`` or ``keep_both_with_suffix``).
         preferred_algos: Priority order for checksum comparison.
         backup_dir: Optional directory to store overwritten files.
+        near_duplicate_ratio: When positive, transfers sharing at least this
+            fraction of content chunks (``FileMetadata.chunks``) with an earlier
+            transfer are annotated as near duplicates; they are still transferred.
     """
     preferred_algos = tuple(algo.lower() for algo in (preferred_algos or ()))
     destination = destination.expanduser().resolve()
@@ -162,25 +237,31 @@ def deduplicate(
                     should_transfer=True,
                 )
             )
+        if near_duplicate_ratio > 0:
+            _flag_near_duplicates(planned, near_duplicate_ratio)
         return planned
 
-    grouped: Dict[str, List[FileMetadata]] = {}
+    if policy not in {'prefer_newer', 'keep_both_with_suffix'}:
+        raise ValueError(f'Unknown policy {policy}')
+
+    grouped: DefaultDict[str, List[FileMetadata]] = defaultdict(list)
     for meta in files:
-        grouped.setdefault(meta.path.name, []).append(meta)
+        grouped[meta.path.name].append(meta)
 
     existing_cache: Dict[Path, Optional[FileMetadata]] = {}
+    dest_names = _scan_destination(destination, len(grouped))
     planned: List[DedupResult] = []
     used_names: Dict[Path, int] = {}
 
     for name, metas in sorted(grouped.items()):
-        metas_sorted = sorted(metas, key=lambda m: (m.size_bytes, m.mtime), reverse=True)
-        if policy not in {'prefer_newer', 'keep_both_with_suffix'}:
-            raise ValueError(f'Unknown policy {policy}')
+        # Most names are unique; only collisions need ranking.
+        metas_sorted = metas if len(metas) == 1 else sorted(metas, key=_RANK_KEY, reverse=True)
 
         if policy == 'prefer_newer':
             winner = metas_sorted[0]
-            dest_path = destination / winner.path.name
-            existing = _load_destination_metadata(dest_path, preferred_algos, existing_cache)
+            # Every member of the group shares this name, so they share the destination path too.
+            dest_path = destination / name
+            existing = _load_destination_metadata(dest_path, preferred_algos, existing_cache, dest_names)
             if existing and _metadata_equal(winner, existing, preferred_algos):
                 planned.append(
                     DedupResult(
@@ -219,13 +300,13 @@ def deduplicate(
                 planned.append(
                     DedupResult(
                         src=meta,
-                        dest_path=destination / meta.path.name,
+                        dest_path=dest_path,
                         decision=Decision.DUPLICATE,
                         reason=_duplicate_reason(meta, winner),
                         should_transfer=False,
                         duplicate_action=duplicate_action,
                         archive_path=(
-                            _build_backup_path(destination / meta.path.name, duplicate_archive_dir)
+                            _build_backup_path(dest_path, duplicate_archive_dir)
                             if duplicate_action == 'archive' and duplicate_archive_dir
                             else None
                         )
@@ -233,8 +314,8 @@ def deduplicate(
                 )
         else:  # keep_both_with_suffix
             for idx, meta in enumerate(metas_sorted, start=1):
-                dest_path, suffix = _unique_dest_path(destination, meta.path.name, used_names)
-                existing = _load_destination_metadata(dest_path, preferred_algos, existing_cache)
+                dest_path, suffix = _unique_dest_path(destination, meta.path.name, used_names, dest_names)
+                existing = _load_destination_metadata(dest_path, preferred_algos, existing_cache, dest_names)
                 if existing and _metadata_equal(meta, existing, preferred_algos):
                     planned.append(
                         DedupResult(
@@ -270,7 +351,7 @@ def deduplicate(
         primary_hash = _primary_checksum(result.src, preferred_algos)
         if (
             primary_hash
-            and result.decision in {Decision.COPY, Decision.REPLACE, Decision.COPY_WITH_SUFFIX}
+            and result.decision in _TRANSFER_DECISIONS
             and result.should_transfer
         ):
             if primary_hash in seen_hashes:
@@ -296,4 +377,6 @@ def deduplicate(
             seen_hashes[primary_hash] = result
         final_results.append(result)
 
+    if near_duplicate_ratio > 0:
+        _flag_near_duplicates(final_results, near_duplicate_ratio)
     return final_results
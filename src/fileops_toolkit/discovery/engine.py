@@ -2,9 +2,9 @@
 
 This module provides utilities to recursively search source directories for
 files matching a set of extensions.  It yields absolute file paths for
-downstream processing.  The current implementation uses Python's
-``os.walk`` and is designed to be replaced or augmented with faster tools
-such as ``fd``/``fdfind`` via subprocess if desired.
+downstream processing.  The pure-Python walker is built on ``os.scandir``
+and is augmented with faster tools such as ``fd``/``fdfind`` or ``find``
+via subprocess when they are available.
 """
 
 from __future__ import annotations
@@ -14,9 +14,10 @@ import shutil
 import subprocess
 from dataclasses import dataclass
 import fnmatch
+import functools
 import re
 from pathlib import Path
-from typing import Iterable, Iterator, Optional, Sequence
+from typing import Callable, Iterable, Iterator, Optional, Sequence, Set, Tuple
 
 
 @dataclass(frozen=True)
@@ -24,6 +25,45 @@ class DiscoveredFile:
     path: Path
     root: Path
     relative_path: Path
+    # Stat captured during traversal, when the walker already has one.
+    stat_result: Optional[os.stat_result] = None
+
+
+@dataclass(frozen=True)
+class DiscoveryFilter:
+    """Extension and pattern filters compiled once for reuse across discoveries."""
+
+    extensions: Tuple[str, ...]
+    matchers: Tuple[Callable[[str], object], ...]
+    # Dotted suffixes for ``str.endswith``; lower-cased unless matching is case-sensitive.
+    ext_suffixes: Tuple[str, ...] = ()
+    ext_case_sensitive: bool = False
+    # Same suffixes as a set, only built for long extension lists (see _SUFFIX_SET_MIN).
+    ext_suffix_set: frozenset = frozenset()
+
+    @property
+    def use_ext_filters(self) -> bool:
+        # External tools only handle extension filters; patterns need Python matching.
+        return bool(self.extensions and not self.matchers)
+
+    def match_extension(self, name: str) -> bool:
+        if not self.ext_suffixes:
+            return True
+        if not self.ext_case_sensitive:
+            name = name.lower()
+        if self.ext_suffix_set:
+            # One set lookup per dot in the name, however many extensions are configured.
+            idx = name.find('.')
+            while idx != -1:
+                if name[idx:] in self.ext_suffix_set:
+                    return True
+                idx = name.find('.', idx + 1)
+            return False
+        return name.endswith(self.ext_suffixes)
+
+
+# Extension lists at least this long are matched by set lookup instead of endswith(tuple).
+_SUFFIX_SET_MIN = 64
 
 
 class DiscoveryError(RuntimeError):
@@ -77,41 +117,130 @@ def _run_find(tool_path: str, source: Path, extensions: Sequence[str]) -> Iterat
         yield Path(os.fsdecode(raw))
 
 
-def _walk_python(source: Path, extensions: Sequence[str] | None = None) -> Iterator[Path]:
-    normalized_exts = {ext.lower().lstrip('.') for ext in extensions or ()}
-    for root, _, files in os.walk(source):
-        for name in files:
-            if not normalized_exts or name.lower().split('.')[-1] in normalized_exts:
-                yield Path(root) / name
+def _walk_python(
+    source: Path,
+    name_filter: Optional[Callable[[str], bool]] = None,
+    *,
+    follow_symlinks: bool = False,
+) -> Iterator[Tuple[Path, os.DirEntry]]:
+    """Walk ``source`` depth-first with ``os.scandir``, yielding matching file entries.
+
+    Directory order matches ``os.walk`` (top-down, files before subdirectories)
+    and unreadable directories are skipped just like ``os.walk`` does by default.
+    With ``follow_symlinks`` symlinked directories are descended too, and each
+    directory is entered at most once by ``(st_dev, st_ino)`` so link cycles and
+    multiple links to the same tree are walked only once.
+    """
+    seen: Set[Tuple[int, int]] = set()
+    if follow_symlinks:
+        try:
+            root_stat = os.stat(source)
+            seen.add((root_stat.st_dev, root_stat.st_ino))
+        except OSError:
+            pass
+    stack = [os.fspath(source)]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        if not follow_symlinks:
+                            if not entry.is_symlink():
+                                subdirs.append(entry.path)
+                            continue
+                        try:
+                            dir_stat = entry.stat()
+                        except OSError:
+                            continue
+                        key = (dir_stat.st_dev, dir_stat.st_ino)
+                        if key not in seen:
+                            seen.add(key)
+                            subdirs.append(entry.path)
+                        continue
+                    if name_filter is None or name_filter(entry.name):
+                        yield Path(entry.path), entry
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
+
 
+def _entry_stat(entry: Optional[os.DirEntry]) -> Optional[os.stat_result]:
+    if entry is None:
+        return None
+    try:
+        return entry.stat()
+    except OSError:
+        # Let the metadata scanner surface the error for this path.
+        return None
 
-def _compile_patterns(patterns: Sequence[str], mode: str, case_sensitive: bool) -> list:
-    compiled = []
+
+def _compile_patterns(patterns: Sequence[str], mode: str, case_sensitive: bool) -> Tuple[Callable[[str], object], ...]:
     if not patterns:
-        return compiled
+        return ()
     mode = mode.lower()
     if mode not in {'glob', 'regex'}:
         raise DiscoveryError(f'Unsupported pattern_mode: {mode}')
     flags = 0 if case_sensitive else re.IGNORECASE
-    for pattern in patterns:
-        if mode == 'glob':
-            compiled.append((pattern, None))
-        else:
-            compiled.append((None, re.compile(pattern, flags)))
-    return compiled
+    if mode == 'glob':
+        # Globs must match the whole path, regexes may match anywhere.
+        return tuple(re.compile(fnmatch.translate(pattern), flags).match for pattern in patterns)
+    return tuple(re.compile(pattern, flags).search for pattern in patterns)
 
 
-def _pattern_match(path: Path, compiled_patterns: list, case_sensitive: bool) -> bool:
-    if not compiled_patterns:
+def _pattern_match(path: Path, matchers: Sequence[Callable[[str], object]]) -> bool:
+    if not matchers:
         return True
     text = path.as_posix()
-    for glob_pattern, regex in compiled_patterns:
-        if glob_pattern is not None:
-            if fnmatch.fnmatch(text if case_sensitive else text.lower(), glob_pattern if case_sensitive else glob_pattern.lower()):
-                return True
-        elif regex and regex.search(text):
-            return True
-    return False
+    return any(match(text) for match in matchers)
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_filter_cached(
+    extensions: Tuple[str, ...],
+    patterns: Tuple[str, ...],
+    pattern_mode: str,
+    case_sensitive: bool,
+    extension_case_sensitive: bool,
+) -> DiscoveryFilter:
+    stripped = tuple(ext.lstrip('.') for ext in extensions)
+    if not extension_case_sensitive:
+        stripped = tuple(ext.lower() for ext in stripped)
+    ext_suffixes = tuple(dict.fromkeys(f'.{ext}' for ext in stripped))
+    return DiscoveryFilter(
+        extensions=extensions,
+        matchers=_compile_patterns(patterns, pattern_mode, case_sensitive),
+        ext_suffixes=ext_suffixes,
+        ext_case_sensitive=extension_case_sensitive,
+        ext_suffix_set=frozenset(ext_suffixes) if len(ext_suffixes) >= _SUFFIX_SET_MIN else frozenset(),
+    )
+
+
+def compile_filter(
+    extensions: Sequence[str] | None = None,
+    patterns: Sequence[str] | None = None,
+    pattern_mode: str = 'glob',
+    case_sensitive: bool = False,
+    *,
+    extension_case_sensitive: bool = False,
+) -> DiscoveryFilter:
+    """Compile extension and pattern filters, reusing previous compilations.
+
+    ``case_sensitive`` applies to patterns; extensions match case-insensitively
+    unless ``extension_case_sensitive`` is set, which also skips lower-casing
+    every file name.
+    """
+    return _compile_filter_cached(
+        tuple(extensions or ()),
+        tuple(patterns or ()),
+        pattern_mode,
+        case_sensitive,
+        extension_case_sensitive,
+    )
 
 
 def _filter_paths(
@@ -120,9 +249,9 @@ def _filter_paths(
     pattern_mode: str,
     case_sensitive: bool,
 ) -> Iterator[Path]:
-    compiled = _compile_patterns(patterns or (), pattern_mode, case_sensitive)
+    matchers = compile_filter(patterns=patterns, pattern_mode=pattern_mode, case_sensitive=case_sensitive).matchers
     for path in paths:
-        if _pattern_match(path, compiled, case_sensitive):
+        if _pattern_match(path, matchers):
             yield path
 
 
@@ -134,9 +263,18 @@ def discover_files(
     pattern_mode: str = 'glob',
     case_sensitive: bool = False,
     use_external: bool = True,
+    compiled_filter: Optional[DiscoveryFilter] = None,
+    follow_symlinks: bool = False,
 ) -> Iterator[DiscoveredFile]:
-    """Yield discovered files with root and relative path metadata."""
+    """Yield discovered files with root and relative path metadata.
+
+    ``compiled_filter`` takes precedence over ``extensions``/``patterns`` and
+    skips recompiling them; build one with :func:`compile_filter`.
+    ``follow_symlinks`` descends into symlinked directories, visiting each
+    directory once; it always uses the Python walker, which tracks inodes.
+    """
     resolved_sources = [Path(src).expanduser() for src in sources]
+    use_external = use_external and not follow_symlinks
     tool_path, tool_name = _which_tool() if use_external else (None, '')
     # Validate sources early to surface helpful errors.
     for src in resolved_sources:
@@ -145,26 +283,38 @@ def discover_files(
         if not src.is_dir():
             raise DiscoveryError(f'Source path is not a directory: {src}')
 
-    use_ext_filters = bool(extensions and not patterns)
-    normalized_exts = {ext.lower().lstrip('.') for ext in (extensions or ())}
-    compiled_patterns = _compile_patterns(patterns or (), pattern_mode, case_sensitive)
+    if compiled_filter is None:
+        compiled_filter = compile_filter(extensions, patterns, pattern_mode, case_sensitive)
+    extensions = compiled_filter.extensions
+    use_ext_filters = compiled_filter.use_ext_filters
+    match_extension = compiled_filter.match_extension
+    matchers = compiled_filter.matchers
 
     for src in resolved_sources:
+        iterator: Iterable[Tuple[Path, Optional[os.DirEntry]]]
+        # The Python walker applies the extension filter itself; everything else is re-checked below.
+        check_extension = bool(compiled_filter.ext_suffixes)
         if use_external and tool_path and tool_name in {'fdfind', 'fd'} and use_ext_filters:
-            iterator = (src / rel if not rel.is_absolute() else rel for rel in _run_fd(tool_path, src, extensions or ()))
+            iterator = (
+                (src / rel if not rel.is_absolute() else rel, None)
+                for rel in _run_fd(tool_path, src, extensions or ())
+            )
         elif use_external and tool_path and tool_name == 'find' and use_ext_filters:
-            iterator = _run_find(tool_path, src, extensions or ())
+            iterator = ((path, None) for path in _run_find(tool_path, src, extensions or ()))
+        elif use_ext_filters:
+            iterator = _walk_python(src, match_extension, follow_symlinks=follow_symlinks)
+            check_extension = False
         else:
-            iterator = _walk_python(src, extensions if use_ext_filters else None)
+            iterator = _walk_python(src, follow_symlinks=follow_symlinks)
 
-        for path in iterator:
-            if normalized_exts and path.suffix:
-                if path.suffix.lower().lstrip('.') not in normalized_exts and path.name.lower().split('.')[-1] not in normalized_exts:
-                    continue
-            if compiled_patterns and not _pattern_match(path, compiled_patterns, case_sensitive):
+        for path, entry in iterator:
+            if check_extension and path.suffix and not match_extension(path.name):
+                continue
+            if matchers and not _pattern_match(path, matchers):
                 continue
             yield DiscoveredFile(
                 path=path,
                 root=src,
                 relative_path=path.relative_to(src),
+                stat_result=_entry_stat(entry),
             )
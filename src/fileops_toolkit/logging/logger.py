@@ -11,7 +11,7 @@ import json
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional, Sequence
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
 
 from ..deduplication.engine import DedupResult
 from ..metadata.scanner import FileMetadata
@@ -37,6 +37,9 @@ CSV_FIELDS = [
     'verified',
 ]
 
+# Log files are written through a 64 KiB buffer instead of flushing per row.
+WRITE_BUFFER_SIZE = 1 << 16
+
 
 def _ensure_parent(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -52,33 +55,75 @@ def _resolve_template(template: str, run_id: str) -> str:
 
 
 class CSVLogger:
-    def __init__(self, path: Path, fieldnames: Sequence[str]):
+    """Buffered CSV writer; rows reach disk on close or every ``flush_every`` rows."""
+
+    def __init__(self, path: Path, fieldnames: Sequence[str], *, flush_every: int = 0):
         _ensure_parent(path)
         self.path = path
-        self.file = path.open('w', newline='', encoding='utf-8')
-        self.writer = csv.DictWriter(self.file, fieldnames=fieldnames)
-        self.writer.writeheader()
+        self.fieldnames = tuple(fieldnames)
+        self.flush_every = max(0, flush_every)
+        self._pending = 0
+        self.file = path.open('w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE)
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(self.fieldnames)
+
+    def __enter__(self) -> 'CSVLogger':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
 
     def log_row(self, row: Dict[str, Any]) -> None:
-        self.writer.writerow(row)
+        self.log_values(tuple(row.get(name, '') for name in self.fieldnames))
+
+    def log_values(self, values: Sequence[Any]) -> None:
+        """Write one row given positionally in ``fieldnames`` order."""
+        self.writer.writerow(values)
+        self._count(1)
+
+    def log_rows(self, rows: Iterable[Sequence[Any]]) -> None:
+        """Write many positional rows with a single ``writerows`` call."""
+        rows = list(rows)
+        self.writer.writerows(rows)
+        self._count(len(rows))
+
+    def _count(self, written: int) -> None:
+        if self.flush_every:
+            self._pending += written
+            if self._pending >= self.flush_every:
+                self.flush()
+
+    def flush(self) -> None:
         self.file.flush()
+        self._pending = 0
 
     def close(self) -> None:
-        self.file.close()
+        if not self.file.closed:
+            self.file.close()
 
 
 class JSONLogger:
+    """Stream entries into a JSON array, one object per line, as they arrive."""
+
     def __init__(self, path: Path):
         _ensure_parent(path)
         self.path = path
-        self.records: list[Dict[str, Any]] = []
+        self.count = 0
+        self.file = path.open('w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE)
+        self.file.write('[')
 
     def add_entry(self, entry: Dict[str, Any]) -> None:
-        self.records.append(entry)
+        self.file.write('\n' if not self.count else ',\n')
+        self.file.write(json.dumps(entry, separators=(',', ':')))
+        self.count += 1
 
     def flush(self) -> None:
-        with self.path.open('w', encoding='utf-8') as fh:
-            json.dump(self.records, fh, indent=2)
+        self.file.flush()
+
+    def close(self) -> None:
+        if not self.file.closed:
+            self.file.write('\n]\n')
+            self.file.close()
 
 
 @dataclass(slots=True)
@@ -89,7 +134,7 @@ class OperationLoggers:
 
     def close(self) -> None:
         self.csv.close()
-        self.json.flush()
+        self.json.close()
 
 
 def setup_loggers(logging_config: Dict[str, Any], run_id: str) -> OperationLoggers:
@@ -97,7 +142,11 @@ def setup_loggers(logging_config: Dict[str, Any], run_id: str) -> OperationLogge
     csv_name = _resolve_template(logging_config.get('csv_file', 'operations.csv'), run_id)
     json_name = _resolve_template(logging_config.get('json_file', 'summary.json'), run_id)
     errors_name = _resolve_template(logging_config.get('errors_file', 'errors.log'), run_id)
-    csv_logger = CSVLogger(log_dir / csv_name, CSV_FIELDS)
+    csv_logger = CSVLogger(
+        log_dir / csv_name,
+        CSV_FIELDS,
+        flush_every=int(logging_config.get('csv_flush_every', 0)),
+    )
     json_logger = JSONLogger(log_dir / json_name)
     errors_path = (log_dir / errors_name).expanduser()
     _ensure_parent(errors_path)
@@ -112,8 +161,7 @@ def _primary_checksum(meta: FileMetadata, preferred: Sequence[str]) -> Optional[
     return meta.checksum
 
 
-def log_operation(
-    loggers: OperationLoggers,
+def _build_row(
     *,
     run_id: str,
     worker: str,
@@ -121,7 +169,8 @@ def log_operation(
     transfer: Optional[TransferOutcome],
     verified: Optional[bool],
     preferred_algos: Sequence[str],
-) -> None:
+) -> Tuple[Any, ...]:
+    """Return the log row for ``result`` as a tuple ordered like ``CSV_FIELDS``."""
     checksum = _primary_checksum(result.src, preferred_algos)
     duration_ms = round((transfer.duration if transfer else 0.0) * 1000, 3)
     exit_code: Any = ''
@@ -134,28 +183,80 @@ def log_operation(
         attempts = transfer.attempts
         if not transfer.success:
             error_msg = transfer.error_message
+    elif result.message and result.message.startswith('duplicate_action_failed:'):
+        # Planner rows have no transfer; a failed archive/delete is their only error.
+        error_msg = result.message
+
+    return (
+        run_id,
+        _timestamp(),
+        worker,
+        str(result.src.path),
+        str(result.dest_path),
+        result.src.size_bytes,
+        result.src.mtime,
+        checksum or '',
+        result.decision.name.lower(),
+        result.reason,
+        result.message or '',
+        duration_ms,
+        exit_code,
+        error_msg,
+        tool,
+        attempts,
+        verified if verified is not None else '',
+    )
+
+
+_ERROR_MSG_INDEX = CSV_FIELDS.index('error_msg')
 
-    row = {
-        'run_id': run_id,
-        'timestamp': _timestamp(),
-        'worker': worker,
-        'src_path': str(result.src.path),
-        'dst_path': str(result.dest_path),
-        'size_bytes': result.src.size_bytes,
-        'mtime_unix': result.src.mtime,
-        'hash': checksum or '',
-        'decision': result.decision.name.lower(),
-        'reason': result.reason,
-        'note': result.message or '',
-        'duration_ms': duration_ms,
-        'rsync_exit': exit_code,
-        'error_msg': error_msg,
-        'tool': tool,
-        'attempts': attempts,
-        'verified': verified if verified is not None else '',
-    }
-    loggers.csv.log_row(row)
+
+def log_operation(
+    loggers: OperationLoggers,
+    *,
+    run_id: str,
+    worker: str,
+    result: DedupResult,
+    transfer: Optional[TransferOutcome],
+    verified: Optional[bool],
+    preferred_algos: Sequence[str],
+) -> None:
+    values = _build_row(
+        run_id=run_id,
+        worker=worker,
+        result=result,
+        transfer=transfer,
+        verified=verified,
+        preferred_algos=preferred_algos,
+    )
+    loggers.csv.log_values(values)
+    row = dict(zip(CSV_FIELDS, values))
     loggers.json.add_entry(row)
-    if error_msg:
+    if values[_ERROR_MSG_INDEX]:
         with loggers.errors_path.open('a', encoding='utf-8') as fh:
             fh.write(json.dumps(row) + '\n')
+
+
+def log_planned(
+    loggers: OperationLoggers,
+    entries: Iterable[Tuple[DedupResult, Optional[bool]]],
+    *,
+    run_id: str,
+    worker: str,
+    preferred_algos: Sequence[str],
+) -> None:
+    """Log ``(result, verified)`` pairs that involve no transfer in one batch."""
+    rows = [
+        _build_row(
+            run_id=run_id,
+            worker=worker,
+            result=result,
+            transfer=None,
+            verified=verified,
+            preferred_algos=preferred_algos,
+        )
+        for result, verified in entries
+    ]
+    loggers.csv.log_rows(rows)
+    for values in rows:
+        loggers.json.add_entry(dict(zip(CSV_FIELDS, values)))
@@ -0,0 +1,64 @@
+"""Persistent checksum cache for FileOps Toolkit.
+
+Checksums are stored in SQLite keyed by ``(st_dev, st_ino, st_size,
+st_mtime_ns, algorithm)``, so an unchanged file is never re-hashed on later
+runs and any change to the file invalidates its entry.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS checksums (
+    dev INTEGER NOT NULL,
+    ino INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    algo TEXT NOT NULL,
+    checksum TEXT NOT NULL,
+    PRIMARY KEY (dev, ino, size, mtime_ns, algo)
+) WITHOUT ROWID
+'''
+
+
+class ChecksumCache:
+    """SQLite-backed checksum cache; safe to share between worker threads."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.path), isolation_level=None, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute(_SCHEMA)
+
+    def __enter__(self) -> 'ChecksumCache':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def get(self, stat: os.stat_result, algo: str) -> Optional[str]:
+        with self._lock:
+            row = self.conn.execute(
+                'SELECT checksum FROM checksums WHERE dev=? AND ino=? AND size=? AND mtime_ns=? AND algo=?',
+                (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns, algo),
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, stat: os.stat_result, algo: str, checksum: str) -> None:
+        with self._lock:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO checksums (dev, ino, size, mtime_ns, algo, checksum) VALUES (?, ?, ?, ?, ?, ?)',
+                (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns, algo, checksum),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
@@ -7,16 +7,25 @@ by the discovery engine.  Hash algorithms are selected via configuration.
 from __future__ import annotations
 
 import hashlib
+import mmap
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, Optional, Sequence, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .cache import ChecksumCache
 
 try:
     import xxhash
 except ImportError:  # pragma: no cover
     xxhash = None  # type: ignore
 
+try:
+    import blake3
+except ImportError:  # pragma: no cover
+    blake3 = None  # type: ignore
+
 
 ChecksumRequest = Optional[Union[str, Sequence[str]]]
 
@@ -29,15 +38,18 @@ def _normalise_algorithms(request: ChecksumRequest) -> list[str]:
     return [algo.lower() for algo in request]
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class FileMetadata:
+    # Immutable and slotted: one of these is held per discovered file. The raw
+    # stat result is not kept; size and mtime are all downstream code needs.
     path: Path
     size_bytes: int
     mtime: float
     checksums: Dict[str, str] = field(default_factory=dict)
-    stat: Optional[os.stat_result] = None
     source_root: Optional[Path] = None
     relative_path: Optional[Path] = None
+    # XXH3-128 digests of content-defined chunks, when chunking is enabled.
+    chunks: Optional[List[bytes]] = None
 
     def get_checksum(self, algo: Optional[str] = None) -> Optional[str]:
         if not self.checksums:
@@ -52,53 +64,128 @@ class FileMetadata:
         return self.get_checksum()
 
 
+# Files are hashed in 1 MiB reads into a reused buffer (unbuffered file object);
+# files of MMAP_THRESHOLD bytes or more are mapped and hashed in place instead.
+READ_CHUNK_SIZE = 1 << 20
+MMAP_THRESHOLD = 4 << 20
+# BLAKE3 switches to its multi-threaded tree mode for files at least this large.
+BLAKE3_THREADED_MIN = 32 << 20
+# Target chunk size for content-defined chunking.
+CDC_AVG_SIZE = 64 << 10
+_MADV_SEQUENTIAL = getattr(mmap, 'MADV_SEQUENTIAL', None)  # not available on Windows
+
+_HASHERS: Dict[str, Callable[[], Any]] = {
+    'md5': hashlib.md5,
+    'sha1': hashlib.sha1,
+}
+if xxhash is not None:
+    _HASHERS.update(
+        {
+            'xxh3_64': xxhash.xxh3_64,
+            'xxh3_128': xxhash.xxh3_128,
+            'xxh128': xxhash.xxh3_128,
+        }
+    )
+if blake3 is not None:
+    _HASHERS['blake3'] = blake3.blake3
+
+
 def compute_checksum(path: Path, algo: str) -> str:
     """Compute a checksum of a file using the given algorithm.
 
-    Supported algorithms: ``md5``, ``sha1``, ``xxh128`` (requires ``xxhash``).
+    Supported algorithms: ``md5``, ``sha1``, and with ``xxhash`` installed
+    ``xxh3_64`` (the fastest; preferred for dedup/verification), ``xxh3_128``
+    and its alias ``xxh128``, and with ``blake3`` installed ``blake3``, which
+    hashes files of ``BLAKE3_THREADED_MIN`` bytes or more on all cores.
     """
-    if algo.lower() == 'md5':
-        h = hashlib.md5()
-    elif algo.lower() == 'sha1':
-        h = hashlib.sha1()
-    elif algo.lower() == 'xxh128':
-        if xxhash is None:
-            raise RuntimeError('xxhash module not installed')
-        h = xxhash.xxh3_128()  # type: ignore[assignment]
-    else:
-        raise ValueError(f'Unsupported checksum algorithm: {algo}')
-    with path.open('rb') as f:
-        for chunk in iter(lambda: f.read(8192), b''):
-            h.update(chunk)
+    algo = algo.lower()
+    try:
+        h = _HASHERS[algo]()
+    except KeyError:
+        if algo.startswith('xxh') and xxhash is None:
+            raise RuntimeError('xxhash module not installed') from None
+        if algo == 'blake3' and blake3 is None:
+            raise RuntimeError('blake3 module not installed') from None
+        raise ValueError(f'Unsupported checksum algorithm: {algo}') from None
+    with path.open('rb', buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_THRESHOLD:
+            if algo == 'blake3' and size >= BLAKE3_THREADED_MIN:
+                h = blake3.blake3(max_threads=blake3.blake3.AUTO)
+            with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mm:
+                if _MADV_SEQUENTIAL is not None:
+                    mm.madvise(_MADV_SEQUENTIAL)
+                h.update(mm)
+            return h.hexdigest()
+        buf = bytearray(READ_CHUNK_SIZE)
+        view = memoryview(buf)
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            h.update(view[:n])
     return h.hexdigest()
 
 
+def compute_chunks(path: Path, avg_size: int = CDC_AVG_SIZE) -> List[bytes]:
+    """Split a file with FastCDC content-defined chunking and hash each chunk.
+
+    Chunk boundaries follow the content, so an insertion only changes the
+    chunks around it; returns one XXH3-128 digest per chunk, in file order.
+    Requires ``fastcdc`` and ``xxhash``.
+    """
+    # Imported lazily: fastcdc announces its pure-Python fallback on import,
+    # and every CLI command imports this module.
+    try:
+        from fastcdc import fastcdc
+    except ImportError:
+        raise RuntimeError('fastcdc module not installed') from None
+    if xxhash is None:
+        raise RuntimeError('xxhash module not installed')
+    if path.stat().st_size == 0:
+        return []
+    # ``hf`` hashes each chunk in place; with fat=False the chunk bytes are never copied out.
+    chunks = fastcdc(str(path), avg_size=avg_size, fat=False, hf=xxhash.xxh3_128)
+    return [bytes.fromhex(chunk.hash) for chunk in chunks]
+
+
 def get_file_metadata(
     path: Path,
     checksum_algo: ChecksumRequest = None,
     *,
     source_root: Optional[Path] = None,
     relative_path: Optional[Path] = None,
+    stat_result: Optional[os.stat_result] = None,
+    chunk_avg_size: int = 0,
+    checksum_cache: Optional[ChecksumCache] = None,
 ) -> FileMetadata:
     """Gather file metadata and optional checksum.
 
     Args:
         path: The file path.
         checksum_algo: Single algorithm or sequence of algorithms to compute (case-insensitive).
+        stat_result: Stat already collected for ``path`` (e.g. during discovery); skips ``stat()``.
+        chunk_avg_size: When positive, also record content-defined chunk digests of roughly this size.
+        checksum_cache: Persistent cache consulted before hashing and updated after.
 
     Returns:
         ``FileMetadata`` with size, modification time and optional checksum.
     """
-    stat = path.stat()
+    stat = stat_result if stat_result is not None else path.stat()
     checksums: Dict[str, str] = {}
     for algo in _normalise_algorithms(checksum_algo):
-        checksums[algo] = compute_checksum(path, algo)
+        cached = checksum_cache.get(stat, algo) if checksum_cache is not None else None
+        if cached is None:
+            cached = compute_checksum(path, algo)
+            if checksum_cache is not None:
+                checksum_cache.put(stat, algo, cached)
+        checksums[algo] = cached
     return FileMetadata(
         path=path,
         size_bytes=stat.st_size,
         mtime=stat.st_mtime,
         checksums=checksums,
-        stat=stat,
         source_root=source_root,
         relative_path=relative_path,
+        chunks=compute_chunks(path, chunk_avg_size) if chunk_avg_size > 0 else None,
     )
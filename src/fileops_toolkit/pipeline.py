@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+import os
+import queue
 import shutil
 import threading
 import time
 import uuid
-from collections import Counter
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 from rich.console import Console
 from rich.progress import (
@@ -22,12 +25,13 @@ from rich.progress import (
 )
 
 from .deduplication.engine import DedupResult, Decision, deduplicate
-from .discovery.engine import DiscoveredFile, discover_files
-from .logging.logger import OperationLoggers, log_operation, setup_loggers
+from .discovery.engine import DiscoveredFile, compile_filter, discover_files
+from .logging.logger import OperationLoggers, log_operation, log_planned, setup_loggers
+from .metadata.cache import ChecksumCache
 from .metadata.scanner import FileMetadata, get_file_metadata
 from .prechecks import PreflightReport, run_prechecks
 from .supervisor.manager import WorkerSupervisor
-from .transfer.engine import TransferOutcome, transfer_file
+from .transfer.engine import DEFAULT_RSYNC_ARGS, TransferOutcome, rsync_flags, transfer_file, transfer_files
 from .verification.engine import verify_file
 from .remote import extract_remote_sources, stage_remote_sources
 
@@ -50,7 +54,7 @@ class PipelineStats:
     metadata_collected: int
     dry_run: bool
     duration_seconds: float
-    decision_counts: Dict[str, int]
+    decision_counts: Counter[str]
     errors: int
     csv_log: Path
     json_log: Path
@@ -76,6 +80,161 @@ def _create_metadata_progress(console: Optional[Console], total: int) -> Progres
     return Progress(*columns, console=console, transient=True, disable=console is None, expand=True)
 
 
+# Bound on discovered files waiting to be hashed and on hashes in flight.
+METADATA_QUEUE_SIZE = 1024
+_DISCOVERY_DONE = object()
+# Non-destructive planner rows (skips, dry-run duplicates) are logged in batches of this size.
+PLANNED_LOG_BATCH = 1024
+
+
+def stream_metadata(
+    discovered: Iterable[DiscoveredFile],
+    checksum_algo: ChecksumConfig = None,
+    *,
+    workers: int = 8,
+    queue_size: int = METADATA_QUEUE_SIZE,
+    chunk_avg_size: int = 0,
+    checksum_cache: Optional[ChecksumCache] = None,
+) -> Iterator[FileMetadata]:
+    """Yield metadata for ``discovered`` in discovery order, overlapping discovery and hashing.
+
+    Discovery runs on its own thread and feeds a bounded queue; a thread pool
+    (hashing releases the GIL) collects metadata with at most ``queue_size``
+    files in flight, so memory stays bounded while disks and CPUs are both
+    kept busy. Errors from discovery or metadata collection are re-raised here.
+    """
+    pending: 'queue.Queue[object]' = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+
+    def put(obj: object) -> bool:
+        # Give up once the consumer has stopped, so a full queue can't block us forever.
+        while not stop.is_set():
+            try:
+                pending.put(obj, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in discovered:
+                if not put(item):
+                    return
+            put(_DISCOVERY_DONE)
+        except BaseException as exc:  # re-raised by the consumer
+            put(exc)
+
+    producer = threading.Thread(target=produce, name='fileops-discovery', daemon=True)
+    producer.start()
+    in_flight: Deque[Future[FileMetadata]] = deque()
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='fileops-metadata') as executor:
+            while True:
+                item = pending.get()
+                if item is _DISCOVERY_DONE:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                in_flight.append(
+                    executor.submit(
+                        get_file_metadata,
+                        Path(item.path),
+                        checksum_algo,
+                        source_root=item.root,
+                        relative_path=item.relative_path,
+                        stat_result=item.stat_result,
+                        chunk_avg_size=chunk_avg_size,
+                        checksum_cache=checksum_cache,
+                    )
+                )
+                if len(in_flight) >= queue_size:
+                    yield in_flight.popleft().result()
+            while in_flight:
+                yield in_flight.popleft().result()
+    finally:
+        stop.set()
+        for future in in_flight:
+            future.cancel()
+        producer.join()
+
+
+def collect_metadata(
+    discovered: Iterable[DiscoveredFile],
+    cfg: Dict[str, Any],
+    *,
+    chunk_avg_size: int = 0,
+) -> Iterator[FileMetadata]:
+    """Run :func:`stream_metadata` with the worker count and checksum cache from ``cfg``.
+
+    The cache (``checksum_cache``) is opened only when checksums are requested
+    and is closed once the stream is exhausted or abandoned.
+    """
+    checksum_algorithms = _normalise_algorithms(cfg.get('checksum_algo'))
+    workers = int(cfg.get('metadata_workers', min(32, (os.cpu_count() or 1) * 4)))
+    checksum_cache = (
+        ChecksumCache(Path(cfg['checksum_cache'])) if cfg.get('checksum_cache') and checksum_algorithms else None
+    )
+    try:
+        yield from stream_metadata(
+            discovered,
+            checksum_algorithms,
+            workers=workers,
+            chunk_avg_size=chunk_avg_size,
+            checksum_cache=checksum_cache,
+        )
+    finally:
+        if checksum_cache is not None:
+            checksum_cache.close()
+
+
+def _backup_destination(result: DedupResult, dry_run: bool) -> None:
+    if (
+        result.backup_path
+        and not dry_run
+        and result.dest_path.exists()
+        and not result.backup_path.exists()
+    ):
+        result.backup_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(result.dest_path, result.backup_path)
+
+
+def _verify_transfer(
+    result: DedupResult,
+    transfer_outcome: TransferOutcome,
+    *,
+    dry_run: bool,
+    verify_algorithms: Sequence[str],
+    verify_after_transfer: bool,
+) -> Optional[bool]:
+    if verify_after_transfer and transfer_outcome.success and not dry_run:
+        return verify_file(
+            result.src.path,
+            result.dest_path,
+            checksum_algos=verify_algorithms,
+            src_metadata=result.src,
+            src_size=result.src.size_bytes,
+        )
+    if transfer_outcome.dry_run:
+        return None
+    return transfer_outcome.success
+
+
+def _failed_transfer(result: DedupResult, exc: Exception, *, tool: str, start: float, dry_run: bool) -> TransferOutcome:
+    return TransferOutcome(
+        src=result.src.path,
+        dst=result.dest_path,
+        success=False,
+        exit_code=1,
+        attempts=1,
+        duration=time.monotonic() - start,
+        tool=tool,
+        stdout='',
+        stderr=str(exc),
+        dry_run=dry_run,
+    )
+
+
 def _make_transfer_task(
     result: DedupResult,
     *,
@@ -94,14 +253,7 @@ def _make_transfer_task(
         verified: Optional[bool] = None
         start = time.monotonic()
         try:
-            if (
-                result.backup_path
-                and not dry_run
-                and result.dest_path.exists()
-                and not result.backup_path.exists()
-            ):
-                result.backup_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(result.dest_path, result.backup_path)
+            _backup_destination(result, dry_run)
             transfer_outcome = transfer_file(
                 result.src.path,
                 result.dest_path,
@@ -112,37 +264,79 @@ def _make_transfer_task(
                 backoff_multiplier=backoff_multiplier,
                 dry_run=dry_run,
             )
-            if verify_after_transfer and transfer_outcome.success and not dry_run:
-                verified = verify_file(
-                    result.src.path,
-                    result.dest_path,
-                    checksum_algos=verify_algorithms,
-                    src_metadata=result.src,
-                )
-            elif transfer_outcome.dry_run:
-                verified = None
-            else:
-                verified = transfer_outcome.success
-        except Exception as exc:  # pragma: no cover - defensive path
-            duration = time.monotonic() - start
-            transfer_outcome = TransferOutcome(
-                src=result.src.path,
-                dst=result.dest_path,
-                success=False,
-                exit_code=1,
-                attempts=1,
-                duration=duration,
-                tool=tool,
-                stdout='',
-                stderr=str(exc),
+            verified = _verify_transfer(
+                result,
+                transfer_outcome,
                 dry_run=dry_run,
+                verify_algorithms=verify_algorithms,
+                verify_after_transfer=verify_after_transfer,
             )
+        except Exception as exc:  # pragma: no cover - defensive path
+            transfer_outcome = _failed_transfer(result, exc, tool=tool, start=start, dry_run=dry_run)
             verified = False
         return OperationOutcome(result=result, transfer=transfer_outcome, verified=verified, worker=worker)
 
     return task
 
 
+def _make_batch_transfer_task(
+    results: Sequence[DedupResult],
+    *,
+    args: Sequence[str],
+    rsync_options: Dict[str, bool],
+    dry_run: bool,
+    max_retries: int,
+    backoff_seconds: float,
+    backoff_multiplier: float,
+    verify_algorithms: Sequence[str],
+    verify_after_transfer: bool,
+) -> Callable[[], List[OperationOutcome]]:
+    """Like ``_make_transfer_task`` but sends ``results`` through one ``transfer_files`` call."""
+
+    def task() -> List[OperationOutcome]:
+        worker = threading.current_thread().name
+        start = time.monotonic()
+        try:
+            for result in results:
+                _backup_destination(result, dry_run)
+            transfers = transfer_files(
+                [(result.src.path, result.dest_path) for result in results],
+                args=args,
+                max_retries=max_retries,
+                backoff_seconds=backoff_seconds,
+                backoff_multiplier=backoff_multiplier,
+                dry_run=dry_run,
+                **rsync_options,
+            )
+        except Exception as exc:  # pragma: no cover - defensive path
+            return [
+                OperationOutcome(
+                    result=result,
+                    transfer=_failed_transfer(result, exc, tool='rsync', start=start, dry_run=dry_run),
+                    verified=False,
+                    worker=worker,
+                )
+                for result in results
+            ]
+        outcomes: List[OperationOutcome] = []
+        for result, transfer_outcome in zip(results, transfers):
+            try:
+                verified = _verify_transfer(
+                    result,
+                    transfer_outcome,
+                    dry_run=dry_run,
+                    verify_algorithms=verify_algorithms,
+                    verify_after_transfer=verify_after_transfer,
+                )
+            except Exception as exc:  # pragma: no cover - defensive path
+                transfer_outcome = _failed_transfer(result, exc, tool=transfer_outcome.tool, start=start, dry_run=dry_run)
+                verified = False
+            outcomes.append(OperationOutcome(result=result, transfer=transfer_outcome, verified=verified, worker=worker))
+        return outcomes
+
+    return task
+
+
 def execute_pipeline(
     cfg: Dict[str, Any],
     *,
@@ -159,6 +353,16 @@ def execute_pipeline(
     parallel_workers = int(cfg.get('parallel_workers', 4))
     transfer_tool = cfg.get('transfer_tool', 'rsync')
     transfer_args = tuple(cfg.get('rsync_args', []))
+    transfer_batch_size = int(cfg.get('transfer_batch_size', 0))
+    chunk_avg_size = int(cfg.get('chunk_avg_size', 0))
+    rsync_options = {
+        'whole_file': bool(cfg.get('rsync_whole_file', False)),
+        'inplace': bool(cfg.get('rsync_inplace', False)),
+        'append_verify': bool(cfg.get('rsync_append_verify', False)),
+    }
+    per_file_args = transfer_args
+    if transfer_tool == 'rsync' and any(rsync_options.values()):
+        per_file_args = (transfer_args or DEFAULT_RSYNC_ARGS) + rsync_flags(**rsync_options)
     verify_after_transfer = cfg.get('verify_after_transfer', True)
     max_retries = int(cfg.get('max_retries', 3))
     backoff_seconds = float(cfg.get('retry_backoff_seconds', 1.0))
@@ -203,32 +407,26 @@ def execute_pipeline(
         str(Path(src).expanduser()) for src in local_sources
     ] + [str(item.staging_path) for item in staged_remote]
 
-    discovered: List[DiscoveredFile] = list(
-        discover_files(
-            effective_sources or [],
-            extensions,
-            patterns=patterns,
-            pattern_mode=pattern_mode,
-            case_sensitive=case_sensitive_patterns,
-        )
+    discovery_filter = compile_filter(
+        extensions,
+        patterns,
+        pattern_mode,
+        case_sensitive_patterns,
+        extension_case_sensitive=bool(cfg.get('extension_case_sensitive', False)),
+    )
+    discovered = discover_files(
+        effective_sources or [],
+        compiled_filter=discovery_filter,
+        follow_symlinks=bool(cfg.get('follow_symlinks', False)),
     )
     metadata: List[FileMetadata] = []
-    metadata_progress = _create_metadata_progress(console, len(discovered))
+    metadata_progress = _create_metadata_progress(console, 0)
     with metadata_progress:
-        task_id: Optional[int] = None
-        if discovered:
-            task_id = metadata_progress.add_task('Collecting metadata', total=len(discovered))
-        for item in discovered:
-            metadata.append(
-                get_file_metadata(
-                    Path(item.path),
-                    checksum_algorithms,
-                    source_root=item.root,
-                    relative_path=item.relative_path,
-                )
-            )
-            if task_id is not None:
-                metadata_progress.advance(task_id)
+        # Discovery is still running while metadata streams in, so the total is unknown.
+        task_id = metadata_progress.add_task('Collecting metadata', total=None)
+        for meta in collect_metadata(discovered, cfg, chunk_avg_size=chunk_avg_size):
+            metadata.append(meta)
+            metadata_progress.advance(task_id)
 
     dedup_results = deduplicate(
         metadata,
@@ -240,6 +438,7 @@ def execute_pipeline(
         duplicate_action=duplicate_action,
         duplicate_archive_dir=duplicate_archive_dir,
         mirror_prefix_with_root=mirror_prefix_with_root,
+        near_duplicate_ratio=float(cfg.get('near_duplicate_ratio', 0.5)) if chunk_avg_size > 0 else 0.0,
     )
 
     loggers = setup_loggers(cfg.get('logging', {}), run_id)
@@ -250,14 +449,28 @@ def execute_pipeline(
     errors = 0
 
     try:
+        planned_entries: List[Tuple[DedupResult, Optional[bool]]] = []
+
+        def flush_planned() -> None:
+            log_planned(
+                loggers,
+                planned_entries,
+                run_id=run_id,
+                worker='planner',
+                preferred_algos=checksum_algorithms,
+            )
+            planned_entries.clear()
+
         for result in skipped_results:
-            transfer_record: Optional[TransferOutcome] = None
             verified_flag = False if result.decision == Decision.DUPLICATE else None
             if (
                 result.decision == Decision.DUPLICATE
                 and result.duplicate_action in {'archive', 'delete'}
                 and not dry_run
             ):
+                # Destructive actions are logged one by one, straight after the
+                # action, so an interrupted run still has its audit trail.
+                flush_planned()
                 try:
                     if result.duplicate_action == 'archive' and result.archive_path:
                         result.archive_path.parent.mkdir(parents=True, exist_ok=True)
@@ -270,15 +483,21 @@ def execute_pipeline(
                 except Exception as exc:  # pragma: no cover - defensive
                     result.message = f'duplicate_action_failed:{exc}'
                     errors += 1
-            log_operation(
-                loggers,
-                run_id=run_id,
-                worker='planner',
-                result=result,
-                transfer=transfer_record,
-                verified=verified_flag,
-                preferred_algos=checksum_algorithms,
-            )
+                log_operation(
+                    loggers,
+                    run_id=run_id,
+                    worker='planner',
+                    result=result,
+                    transfer=None,
+                    verified=verified_flag,
+                    preferred_algos=checksum_algorithms,
+                )
+                loggers.csv.flush()
+                continue
+            planned_entries.append((result, verified_flag))
+            if len(planned_entries) >= PLANNED_LOG_BATCH:
+                flush_planned()
+        flush_planned()
 
         transfer_progress: Optional[Progress] = None
         transfer_task_id: Optional[int] = None
@@ -299,14 +518,34 @@ def execute_pipeline(
                 preferred_algos=checksum_algorithms,
             )
 
-        if transfer_progress:
-            with transfer_progress:
-                transfer_task_id = transfer_progress.add_task('Transferring files', total=len(transfer_candidates))
-                task_factories = [
+        def handle_batch(outcomes: List[OperationOutcome]) -> None:
+            for outcome in outcomes:
+                handle_outcome(outcome)
+
+        def run_transfers() -> None:
+            with WorkerSupervisor(max_workers=parallel_workers) as supervisor:
+                if transfer_batch_size > 0 and transfer_tool == 'rsync':
+                    batch_factories = (
+                        _make_batch_transfer_task(
+                            transfer_candidates[offset : offset + transfer_batch_size],
+                            args=transfer_args,
+                            rsync_options=rsync_options,
+                            dry_run=dry_run,
+                            max_retries=max_retries,
+                            backoff_seconds=backoff_seconds,
+                            backoff_multiplier=backoff_multiplier,
+                            verify_algorithms=checksum_algorithms,
+                            verify_after_transfer=verify_after_transfer,
+                        )
+                        for offset in range(0, len(transfer_candidates), transfer_batch_size)
+                    )
+                    supervisor.run_tasks(batch_factories, progress_callback=handle_batch)
+                    return
+                task_factories = (
                     _make_transfer_task(
                         result,
                         tool=transfer_tool,
-                        args=transfer_args,
+                        args=per_file_args,
                         dry_run=dry_run,
                         max_retries=max_retries,
                         backoff_seconds=backoff_seconds,
@@ -315,27 +554,16 @@ def execute_pipeline(
                         verify_after_transfer=verify_after_transfer,
                     )
                     for result in transfer_candidates
-                ]
-                with WorkerSupervisor(max_workers=parallel_workers) as supervisor:
-                    supervisor.run_tasks(task_factories, progress_callback=handle_outcome)
-        else:
-            task_factories = [
-                _make_transfer_task(
-                    result,
-                    tool=transfer_tool,
-                    args=transfer_args,
-                    dry_run=dry_run,
-                    max_retries=max_retries,
-                    backoff_seconds=backoff_seconds,
-                    backoff_multiplier=backoff_multiplier,
-                    verify_algorithms=checksum_algorithms,
-                    verify_after_transfer=verify_after_transfer,
                 )
-                for result in transfer_candidates
-            ]
-            with WorkerSupervisor(max_workers=parallel_workers) as supervisor:
                 supervisor.run_tasks(task_factories, progress_callback=handle_outcome)
 
+        if transfer_progress:
+            with transfer_progress:
+                transfer_task_id = transfer_progress.add_task('Transferring files', total=len(transfer_candidates))
+                run_transfers()
+        else:
+            run_transfers()
+
         errors = sum(
             1
             for outcome in operation_outcomes
@@ -346,11 +574,11 @@ def execute_pipeline(
     duration = time.monotonic() - start_time
     stats = PipelineStats(
         run_id=run_id,
-        discovered_files=len(discovered),
+        discovered_files=len(metadata),
         metadata_collected=len(metadata),
         dry_run=dry_run,
         duration_seconds=duration,
-        decision_counts=dict(decision_counts),
+        decision_counts=decision_counts,
         errors=errors,
         csv_log=loggers.csv.path,
         json_log=loggers.json.path,
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import importlib
+import importlib.util
 import shutil
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -93,6 +94,15 @@ def run_prechecks(cfg: Dict[str, Any], remote_sources: Sequence[RemoteSourceConf
             importlib.import_module('xxhash')
         except ModuleNotFoundError:
             report.warnings.append('xxhash module not installed; xxh algorithms unavailable.')
+    if 'blake3' in checksum_algos:
+        try:
+            importlib.import_module('blake3')
+        except ModuleNotFoundError:
+            report.warnings.append('blake3 module not installed; blake3 algorithm unavailable.')
+    if int(cfg.get('chunk_avg_size', 0) or 0) > 0:
+        # find_spec rather than import: fastcdc prints a notice on import without its C build.
+        if importlib.util.find_spec('fastcdc') is None:
+            report.errors.append('chunk_avg_size is set but the fastcdc module is not installed.')
 
     min_free = cfg.get('min_free_bytes')
     if min_free:
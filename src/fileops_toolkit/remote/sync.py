@@ -7,20 +7,12 @@ import re
 import shutil
 import subprocess
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
-
-from rich.console import Console
-from rich.progress import (
-    BarColumn,
-    Progress,
-    SpinnerColumn,
-    TaskProgressColumn,
-    TextColumn,
-    TimeElapsedColumn,
-)
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover
+    from rich.console import Console
 
 REMOTE_PATTERN = re.compile(r'^[^@\s]+@[^:\s]+:.+')
 DEFAULT_REMOTE_ARGS: Tuple[str, ...] = ('-avz', '--info=progress2')
@@ -183,6 +175,17 @@ def stage_remote_sources(
     if not remote_sources:
         return []
 
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    from rich.progress import (
+        BarColumn,
+        Progress,
+        SpinnerColumn,
+        TaskProgressColumn,
+        TextColumn,
+        TimeElapsedColumn,
+    )
+
     staging_root = staging_root.expanduser()
     staging_root.mkdir(parents=True, exist_ok=True)
     default_args = tuple(default_rsync_args or DEFAULT_REMOTE_ARGS)
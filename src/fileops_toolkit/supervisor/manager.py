@@ -1,37 +1,65 @@
 """Worker supervisor for FileOps Toolkit.
 
-Uses a thread pool to execute callable tasks with progress callbacks and
-simple cancellation support.
+Uses a thread (or process) pool to execute callable tasks with progress
+callbacks, bounded in-flight submission and simple cancellation support.
 """
 
 from __future__ import annotations
 
-from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
-from typing import Callable, Iterable, Iterator, List, Optional, TypeVar
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Callable, Iterable, List, Optional, Set, TypeVar
 
 T = TypeVar('T')
 
 
 class WorkerSupervisor:
-    """Manage worker threads for parallel operations."""
+    """Manage worker threads (or processes) for parallel operations.
 
-    def __init__(self, max_workers: int = 4):
+    ``run_tasks`` keeps at most ``max_in_flight`` tasks submitted at a time
+    (``max_workers * 2`` by default) and pulls more from the iterable as they
+    finish, so a lazily built task stream never materialises in full.
+    ``use_processes`` switches to a process pool for CPU-bound work; tasks and
+    their results must then be picklable.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        *,
+        max_in_flight: Optional[int] = None,
+        use_processes: bool = False,
+    ):
         self.max_workers = max_workers
-        self._executor: Optional[ThreadPoolExecutor] = None
-        self._futures: List[Future[T]] = []
+        self.max_in_flight = max(1, max_in_flight or max_workers * 2)
+        self.use_processes = use_processes
+        self._executor: Optional[Executor] = None
+        self._futures: Set[Future[T]] = set()
 
     def __enter__(self) -> 'WorkerSupervisor':
-        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='fileops-worker')
+        self._ensure_executor()
         return self
 
     def __exit__(self, exc_type, exc, tb) -> None:
         self.shutdown(wait=True)
 
-    def submit(self, task: Callable[[], T]) -> Future[T]:
+    def _ensure_executor(self) -> Executor:
         if self._executor is None:
-            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='fileops-worker')
-        future = self._executor.submit(task)
-        self._futures.append(future)
+            if self.use_processes:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='fileops-worker')
+        return self._executor
+
+    def submit(self, task: Callable[[], T]) -> Future[T]:
+        future = self._ensure_executor().submit(task)
+        self._futures.add(future)
         return future
 
     def run_tasks(
@@ -39,15 +67,22 @@ class WorkerSupervisor:
         tasks: Iterable[Callable[[], T]],
         progress_callback: Optional[Callable[[T], None]] = None,
     ) -> List[T]:
-        """Run callables and return their results."""
+        """Run callables and return their results in completion order."""
         results: List[T] = []
-        for task in tasks:
-            self.submit(task)
+        pending = iter(tasks)
+        exhausted = False
 
-        while self._futures:
-            done, _ = wait(self._futures, return_when=FIRST_COMPLETED)
-            for future in list(done):
-                self._futures.remove(future)
+        while True:
+            while not exhausted and len(self._futures) < self.max_in_flight:
+                task = next(pending, None)
+                if task is None:
+                    exhausted = True
+                    break
+                self.submit(task)
+            if not self._futures:
+                break
+            done, self._futures = wait(self._futures, return_when=FIRST_COMPLETED)
+            for future in done:
                 result = future.result()
                 results.append(result)
                 if progress_callback:
@@ -8,12 +8,16 @@ the binary is missing.
 
 from __future__ import annotations
 
+import os
 import shutil
 import subprocess
+import tempfile
 import time
+from collections import defaultdict
+from contextlib import ExitStack
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Optional, Sequence
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 
 @dataclass(slots=True)
@@ -38,25 +42,94 @@ class TransferError(RuntimeError):
     """Raised when the transfer tool cannot be executed."""
 
 
-def _run_rsync(src: Path, dst: Path, args: Sequence[str]) -> TransferOutcome:
+DEFAULT_RSYNC_ARGS = ('-aHAX', '--partial', '--info=progress2')
+COPY_CHUNK_SIZE = 1 << 20
+# Bytes of rsync stderr kept on a TransferOutcome when it is not sent to a file.
+STDERR_TAIL_BYTES = 4096
+
+
+def _run_quiet(
+    cmd: Sequence[str],
+    *,
+    input: Optional[bytes] = None,
+    stdout_path: Optional[Path] = None,
+    stderr_path: Optional[Path] = None,
+) -> Tuple[int, str]:
+    """Run ``cmd`` without holding its output in memory.
+
+    stdout is appended to ``stdout_path`` or discarded.  stderr is appended to
+    ``stderr_path`` or spooled to a temporary file; only its last
+    ``STDERR_TAIL_BYTES`` are returned, for error reporting.
+    """
+    with ExitStack() as stack:
+        stdout: Any = subprocess.DEVNULL
+        if stdout_path is not None:
+            stdout = stack.enter_context(stdout_path.open('ab'))
+        if stderr_path is not None:
+            stderr = stack.enter_context(stderr_path.open('ab'))
+        else:
+            stderr = stack.enter_context(tempfile.TemporaryFile())
+        proc = subprocess.run(cmd, input=input, stdout=stdout, stderr=stderr, check=False)
+        if stderr_path is not None:
+            tail = f'{cmd[0]} exited with {proc.returncode}; see {stderr_path}' if proc.returncode else ''
+        else:
+            stderr.seek(max(0, stderr.tell() - STDERR_TAIL_BYTES))
+            tail = stderr.read().decode('utf-8', 'replace')
+    return proc.returncode, tail
+
+
+def _run_rsync(
+    src: Path,
+    dst: Path,
+    args: Sequence[str],
+    *,
+    stdout_path: Optional[Path] = None,
+    stderr_path: Optional[Path] = None,
+) -> TransferOutcome:
     cmd = ['rsync', *args, str(src), str(dst)]
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    returncode, stderr = _run_quiet(cmd, stdout_path=stdout_path, stderr_path=stderr_path)
     return TransferOutcome(
         src=src,
         dst=dst,
-        success=result.returncode == 0,
-        exit_code=result.returncode,
+        success=returncode == 0,
+        exit_code=returncode,
         attempts=1,
         duration=0.0,
         tool='rsync',
-        stdout=result.stdout,
-        stderr=result.stderr,
+        stdout='',
+        stderr=stderr,
     )
 
 
+def _local_copy(src: Path, dst: Path) -> None:
+    """Copy ``src`` to ``dst`` in-kernel where possible, then copy its metadata.
+
+    ``os.copy_file_range`` keeps the data out of userspace (and can reflink on
+    Btrfs/XFS).  If it is unavailable or refused (e.g. across filesystems), the
+    copy continues from the current offset with 1 MiB ``copyfileobj`` chunks.
+    Like ``shutil.copy2``, copying a file onto itself (or a hard link to it)
+    raises ``shutil.SameFileError`` instead of truncating it.
+    """
+    if dst.exists() and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f'{src} and {dst} are the same file')
+    with src.open('rb', buffering=0) as fsrc, dst.open('wb', buffering=0) as fdst:
+        remaining = os.fstat(fsrc.fileno()).st_size
+        try:
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if not copied:
+                    # Short copy (e.g. a filesystem that stops early): finish in userspace.
+                    shutil.copyfileobj(fsrc, fdst, length=COPY_CHUNK_SIZE)
+                    break
+                remaining -= copied
+        except (AttributeError, OSError):
+            shutil.copyfileobj(fsrc, fdst, length=COPY_CHUNK_SIZE)
+    shutil.copystat(src, dst)
+
+
 def _run_copy(src: Path, dst: Path) -> TransferOutcome:
     try:
-        shutil.copy2(src, dst)
+        _local_copy(src, dst)
     except Exception as exc:  # pragma: no cover - unexpected IO failure
         return TransferOutcome(
             src=src,
@@ -92,8 +165,15 @@ def transfer_file(
     backoff_seconds: float = 1.0,
     backoff_multiplier: float = 2.0,
     dry_run: bool = False,
+    stdout_path: Optional[Path] = None,
+    stderr_path: Optional[Path] = None,
 ) -> TransferOutcome:
-    """Transfer ``src`` to ``dst`` with optional retry/backoff."""
+    """Transfer ``src`` to ``dst`` with optional retry/backoff.
+
+    rsync output is never buffered in memory: stdout is appended to
+    ``stdout_path`` (or discarded) and stderr to ``stderr_path``; without a
+    ``stderr_path`` only its tail is kept on the outcome for error reporting.
+    """
     dst.parent.mkdir(parents=True, exist_ok=True)
     if dry_run:
         return TransferOutcome(
@@ -117,7 +197,13 @@ def transfer_file(
     while True:
         start = time.monotonic()
         if tool == 'rsync' and shutil.which('rsync'):
-            outcome = _run_rsync(src, dst, args or ('-aHAX', '--partial', '--info=progress2'))
+            outcome = _run_rsync(
+                src,
+                dst,
+                args or DEFAULT_RSYNC_ARGS,
+                stdout_path=stdout_path,
+                stderr_path=stderr_path,
+            )
         elif tool == 'rsync':
             outcome = _run_copy(src, dst)
             outcome.tool = 'copy-fallback'
@@ -141,3 +227,115 @@ def transfer_file(
 
     # Should never reach here
     return last_outcome or TransferOutcome(src, dst, False, 1, retries, 0.0, tool, '', 'unknown error')
+
+
+def rsync_flags(*, whole_file: bool = False, inplace: bool = False, append_verify: bool = False) -> Tuple[str, ...]:
+    """Return the optional rsync tuning flags selected by the toggles.
+
+    ``whole_file`` (``-W``) skips the delta algorithm, which only costs CPU
+    for local copies; ``inplace`` writes straight into the destination file;
+    ``append_verify`` resumes partially transferred files.
+    """
+    flags: List[str] = []
+    if whole_file:
+        flags.append('--whole-file')
+    if inplace:
+        flags.append('--inplace')
+    if append_verify:
+        flags.append('--append-verify')
+    return tuple(flags)
+
+
+def _run_rsync_batch(
+    src_dir: Path,
+    dst_dir: Path,
+    names: Sequence[str],
+    args: Sequence[str],
+    *,
+    stdout_path: Optional[Path] = None,
+    stderr_path: Optional[Path] = None,
+) -> int:
+    cmd = ['rsync', *args, '--from0', '--files-from=-', f'{src_dir}/', f'{dst_dir}/']
+    file_list = b'\0'.join(os.fsencode(name) for name in names)
+    returncode, _ = _run_quiet(cmd, input=file_list, stdout_path=stdout_path, stderr_path=stderr_path)
+    return returncode
+
+
+def transfer_files(
+    pairs: Iterable[Tuple[Path, Path]],
+    *,
+    args: Optional[Iterable[str]] = None,
+    whole_file: bool = False,
+    inplace: bool = False,
+    append_verify: bool = False,
+    max_retries: int = 3,
+    backoff_seconds: float = 1.0,
+    backoff_multiplier: float = 2.0,
+    dry_run: bool = False,
+    stdout_path: Optional[Path] = None,
+    stderr_path: Optional[Path] = None,
+) -> List[TransferOutcome]:
+    """Transfer many ``(src, dst)`` pairs with one ``rsync`` per directory pair.
+
+    Pairs whose source and destination share a file name are grouped by
+    ``(src.parent, dst.parent)`` and sent through a single
+    ``rsync --files-from=-`` process.  Renamed pairs, groups whose batch run
+    fails and hosts without ``rsync`` go through :func:`transfer_file`, so
+    every pair still gets its own outcome with retry/backoff.  Outcomes are
+    returned in input order.
+    """
+    pairs = list(pairs)
+    base_args = tuple(args or ()) or DEFAULT_RSYNC_ARGS
+    per_file_args = base_args + rsync_flags(whole_file=whole_file, inplace=inplace, append_verify=append_verify)
+    outcomes: List[Optional[TransferOutcome]] = [None] * len(pairs)
+
+    def fallback(index: int) -> TransferOutcome:
+        src, dst = pairs[index]
+        return transfer_file(
+            src,
+            dst,
+            tool='rsync',
+            args=per_file_args,
+            max_retries=max_retries,
+            backoff_seconds=backoff_seconds,
+            backoff_multiplier=backoff_multiplier,
+            dry_run=dry_run,
+            stdout_path=stdout_path,
+            stderr_path=stderr_path,
+        )
+
+    groups: Dict[Tuple[Path, Path], List[int]] = defaultdict(list)
+    if not dry_run and shutil.which('rsync'):
+        for index, (src, dst) in enumerate(pairs):
+            if src.name == dst.name:
+                groups[(src.parent, dst.parent)].append(index)
+
+    for (src_dir, dst_dir), indices in groups.items():
+        dst_dir.mkdir(parents=True, exist_ok=True)
+        start = time.monotonic()
+        returncode = _run_rsync_batch(
+            src_dir,
+            dst_dir,
+            [pairs[i][0].name for i in indices],
+            per_file_args,
+            stdout_path=stdout_path,
+            stderr_path=stderr_path,
+        )
+        if returncode != 0:
+            continue
+        duration = (time.monotonic() - start) / len(indices)
+        for index in indices:
+            src, dst = pairs[index]
+            outcomes[index] = TransferOutcome(
+                src=src,
+                dst=dst,
+                success=True,
+                exit_code=0,
+                attempts=1,
+                duration=duration,
+                tool='rsync',
+                stdout='',
+                stderr='',
+            )
+
+    return [outcome if outcome is not None else fallback(index) for index, outcome in enumerate(outcomes)]
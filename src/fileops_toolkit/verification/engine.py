@@ -6,8 +6,9 @@ matches the source file in size and (optionally) checksum(s).
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Mapping, Optional, Sequence, Union
+from typing import Dict, Mapping, Optional, Sequence, Union
 
 from ..metadata.scanner import FileMetadata, compute_checksum
 
@@ -27,6 +28,8 @@ def verify_file(
     dst: Path,
     checksum_algos: ChecksumRequest = None,
     src_metadata: Optional[FileMetadata] = None,
+    *,
+    src_size: Optional[int] = None,
 ) -> bool:
     """Verify that ``dst`` matches ``src``.
 
@@ -35,29 +38,39 @@ def verify_file(
         dst: Destination file path.
         checksum_algos: Optional checksum algorithm(s) to compare.
         src_metadata: Optional metadata with precomputed checksums.
+        src_size: Source size already known to the caller; skips ``src.stat()``.
     """
     try:
-        src_stat = src.stat()
-        dst_stat = dst.stat()
+        if src_size is None:
+            src_size = src.stat().st_size
+        dst_size = dst.stat().st_size
     except FileNotFoundError:
         return False
 
-    if src_stat.st_size != dst_stat.st_size:
+    if src_size != dst_size:
         return False
 
     algorithms = _normalise(checksum_algos)
     if not algorithms:
         return True
 
-    src_checksums: Mapping[str, str] = {}
+    src_checksums: Dict[str, str] = {}
     if src_metadata:
         src_checksums = {k.lower(): v for k, v in src_metadata.checksums.items()}
 
-    for algo in algorithms:
-        src_checksum = src_checksums.get(algo)
-        if src_checksum is None:
-            src_checksum = compute_checksum(src, algo)
-        dst_checksum = compute_checksum(dst, algo)
-        if src_checksum != dst_checksum:
-            return False
-    return True
+    missing = [algo for algo in algorithms if algo not in src_checksums]
+    if missing:
+        # Hashing releases the GIL, so hash src on a helper thread while dst
+        # is hashed here; this overlaps the reads when they hit separate devices.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            src_future = executor.submit(_checksums, src, missing)
+            dst_checksums = _checksums(dst, algorithms)
+            src_checksums.update(src_future.result())
+    else:
+        dst_checksums = _checksums(dst, algorithms)
+
+    return all(src_checksums[algo] == dst_checksums[algo] for algo in algorithms)
+
+
+def _checksums(path: Path, algorithms: Sequence[str]) -> Mapping[str, str]:
+    return {algo: compute_checksum(path, algo) for algo in algorithms}
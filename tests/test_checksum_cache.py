@@ -0,0 +1,83 @@
+"""Tests for the persistent SQLite checksum cache."""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from fileops_toolkit.metadata.cache import ChecksumCache
+from fileops_toolkit.metadata.scanner import get_file_metadata
+
+
+def _file(tmp_path, name: str = 'data.bin', data: bytes = b'payload'):
+    path = tmp_path / name
+    path.write_bytes(data)
+    return path
+
+
+def test_hit_on_unchanged_stat(tmp_path):
+    path = _file(tmp_path)
+    with ChecksumCache(tmp_path / 'cache.db') as cache:
+        cache.put(os.stat(path), 'md5', 'abc')
+        assert cache.get(os.stat(path), 'md5') == 'abc'
+    # Entries persist across connections.
+    with ChecksumCache(tmp_path / 'cache.db') as cache:
+        assert cache.get(os.stat(path), 'md5') == 'abc'
+
+
+def test_miss_after_size_change(tmp_path):
+    path = _file(tmp_path)
+    with ChecksumCache(tmp_path / 'cache.db') as cache:
+        before = os.stat(path)
+        cache.put(before, 'md5', 'abc')
+        path.write_bytes(b'payload and more')
+        os.utime(path, ns=(before.st_atime_ns, before.st_mtime_ns))
+        assert cache.get(os.stat(path), 'md5') is None
+
+
+def test_miss_after_mtime_change(tmp_path):
+    path = _file(tmp_path)
+    with ChecksumCache(tmp_path / 'cache.db') as cache:
+        before = os.stat(path)
+        cache.put(before, 'md5', 'abc')
+        os.utime(path, ns=(before.st_atime_ns, before.st_mtime_ns + 1))
+        assert cache.get(os.stat(path), 'md5') is None
+
+
+def test_entries_are_keyed_per_algorithm(tmp_path):
+    path = _file(tmp_path)
+    with ChecksumCache(tmp_path / 'cache.db') as cache:
+        stat = os.stat(path)
+        cache.put(stat, 'md5', 'md5-digest')
+        assert cache.get(stat, 'sha1') is None
+        cache.put(stat, 'sha1', 'sha-digest')
+        assert cache.get(stat, 'md5') == 'md5-digest'
+        assert cache.get(stat, 'sha1') == 'sha-digest'
+
+
+def test_get_file_metadata_uses_cached_checksum(tmp_path):
+    path = _file(tmp_path)
+    with ChecksumCache(tmp_path / 'cache.db') as cache:
+        first = get_file_metadata(path, 'md5', checksum_cache=cache)
+        assert cache.get(os.stat(path), 'md5') == first.checksums['md5']
+        # A planted value proves the second lookup is served from the cache.
+        cache.put(os.stat(path), 'md5', 'from-cache')
+        assert get_file_metadata(path, 'md5', checksum_cache=cache).checksums['md5'] == 'from-cache'
+
+
+def test_concurrent_use_from_thread_pool(tmp_path):
+    paths = [_file(tmp_path, f'f{i}.bin', bytes([i]) * (i + 1)) for i in range(64)]
+    with ChecksumCache(tmp_path / 'cache.db') as cache:
+
+        def work(path):
+            stat = os.stat(path)
+            cache.put(stat, 'md5', path.name)
+            return cache.get(stat, 'md5')
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            results = list(executor.map(work, paths * 4))
+
+        assert results == [path.name for path in paths * 4]
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            metas = list(executor.map(lambda p: get_file_metadata(p, 'sha1', checksum_cache=cache), paths))
+        assert all(cache.get(os.stat(m.path), 'sha1') == m.checksums['sha1'] for m in metas)
@@ -0,0 +1,73 @@
+"""Tests for content-defined chunking in the metadata scanner."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+pytest.importorskip('fastcdc')
+xxhash = pytest.importorskip('xxhash')
+
+from fileops_toolkit.metadata.scanner import compute_chunks, get_file_metadata  # noqa: E402
+
+AVG_SIZE = 16 << 10
+
+
+def _payload(size: int, seed: int = 0) -> bytes:
+    # Deterministic pseudo-random bytes so chunk boundaries are stable across runs.
+    rng = xxhash.xxh64(str(seed).encode())
+    out = bytearray()
+    counter = 0
+    while len(out) < size:
+        rng.update(counter.to_bytes(8, 'little'))
+        out += rng.digest()
+        counter += 1
+    return bytes(out[:size])
+
+
+def test_chunks_are_xxh3_128_digests_covering_the_file(tmp_path):
+    from fastcdc import fastcdc
+
+    data = _payload(512 << 10)
+    path = tmp_path / 'blob.bin'
+    path.write_bytes(data)
+
+    chunks = compute_chunks(path, avg_size=AVG_SIZE)
+
+    boundaries = list(fastcdc(str(path), avg_size=AVG_SIZE))
+    assert len(chunks) == len(boundaries) > 1
+    assert sum(c.length for c in boundaries) == len(data)
+    expected = [xxhash.xxh3_128_digest(data[c.offset:c.offset + c.length]) for c in boundaries]
+    assert chunks == expected
+    assert all(isinstance(c, bytes) and len(c) == 16 for c in chunks)
+
+
+def test_empty_file_has_no_chunks(tmp_path):
+    path = tmp_path / 'empty.bin'
+    path.write_bytes(b'')
+    assert compute_chunks(path, avg_size=AVG_SIZE) == []
+
+
+def test_insertion_keeps_most_chunks(tmp_path):
+    data = _payload(1 << 20, seed=1)
+    original = tmp_path / 'a.bin'
+    edited = tmp_path / 'b.bin'
+    original.write_bytes(data)
+    middle = len(data) // 2
+    edited.write_bytes(data[:middle] + b'inserted bytes' + data[middle:])
+
+    before = compute_chunks(original, avg_size=AVG_SIZE)
+    after = compute_chunks(edited, avg_size=AVG_SIZE)
+
+    shared = set(before) & set(after)
+    assert len(shared) >= len(before) - 2
+
+
+def test_get_file_metadata_records_chunks(tmp_path):
+    path = tmp_path / 'blob.bin'
+    path.write_bytes(_payload(128 << 10, seed=2))
+
+    meta = get_file_metadata(path, chunk_avg_size=AVG_SIZE, stat_result=os.stat(path))
+
+    assert meta.chunks == compute_chunks(path, avg_size=AVG_SIZE)
@@ -0,0 +1,72 @@
+"""Tests for destination collision handling in the deduplication planner."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from fileops_toolkit.deduplication import engine
+from fileops_toolkit.deduplication.engine import Decision, deduplicate
+from fileops_toolkit.metadata.scanner import FileMetadata
+
+
+def _source(tmp_path: Path, name: str, data: bytes = b'new') -> FileMetadata:
+    path = tmp_path / 'src' / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    st = path.stat()
+    return FileMetadata(path=path, size_bytes=st.st_size, mtime=st.st_mtime)
+
+
+@pytest.fixture
+def case_insensitive_dest(tmp_path, monkeypatch):
+    """Make ``Path.exists`` resolve names in ``dest`` case-insensitively, like NTFS or APFS."""
+    dest = tmp_path / 'dest'
+    dest.mkdir()
+    real_exists = Path.exists
+
+    def exists(self, *args, **kwargs):
+        if self.parent == dest.resolve():
+            return self.name.casefold() in {name.casefold() for name in os.listdir(dest)}
+        return real_exists(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, 'exists', exists)
+    return dest
+
+
+def test_casefold_collision_gets_a_suffix(tmp_path, case_insensitive_dest):
+    (case_insensitive_dest / 'REPORT.ISO').write_bytes(b'old')
+    meta = _source(tmp_path, 'report.iso')
+
+    [result] = deduplicate([meta], case_insensitive_dest, policy='keep_both_with_suffix')
+
+    assert result.dest_path.name == 'report_1.iso'
+    assert result.decision == Decision.COPY_WITH_SUFFIX
+
+
+def test_scan_is_capped_relative_to_the_plan(tmp_path, monkeypatch):
+    monkeypatch.setattr(engine, '_DEST_SCAN_MIN', 4)
+    dest = tmp_path / 'dest'
+    dest.mkdir()
+    for i in range(10):
+        (dest / f'f{i}.iso').write_bytes(b'')
+
+    assert engine._scan_destination(dest, planned_names=1) is None
+    assert engine._scan_destination(dest, planned_names=3) == frozenset(f'f{i}.iso' for i in range(10))
+    assert engine._scan_destination(tmp_path / 'missing', planned_names=1) == frozenset()
+
+
+def test_large_destination_falls_back_to_exists(tmp_path, monkeypatch):
+    monkeypatch.setattr(engine, '_DEST_SCAN_MIN', 4)
+    dest = tmp_path / 'dest'
+    dest.mkdir()
+    for i in range(10):
+        (dest / f'f{i}.iso').write_bytes(b'old')
+    metas = [_source(tmp_path, 'f3.iso'), _source(tmp_path, 'fresh.iso')]
+
+    results = {r.src.path.name: r for r in deduplicate(metas, dest, policy='keep_both_with_suffix')}
+
+    assert results['f3.iso'].dest_path.name == 'f3_1.iso'
+    assert results['fresh.iso'].dest_path.name == 'fresh.iso'
@@ -0,0 +1,53 @@
+"""Tests for the Python directory walker used by discovery."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from fileops_toolkit.discovery.engine import _walk_python, discover_files
+
+
+@pytest.fixture
+def linked_tree(tmp_path):
+    """``root`` with nested files, a ``loop -> ..`` cycle and a second link to ``a/b``.
+
+    Also contains a symlink to a directory outside ``root`` and a broken symlink.
+    """
+    root = tmp_path / 'root'
+    (root / 'a' / 'b').mkdir(parents=True)
+    (root / 'c').mkdir()
+    (root / 'top.iso').write_bytes(b'top')
+    (root / 'a' / 'one.iso').write_bytes(b'one')
+    (root / 'a' / 'b' / 'two.iso').write_bytes(b'two')
+    (root / 'c' / 'three.iso').write_bytes(b'three')
+    (root / 'a' / 'b' / 'loop').symlink_to('..', target_is_directory=True)
+    (root / 'c' / 'again').symlink_to(root / 'a' / 'b', target_is_directory=True)
+    outside = tmp_path / 'outside'
+    outside.mkdir()
+    (outside / 'far.iso').write_bytes(b'far')
+    (root / 'ext').symlink_to(outside, target_is_directory=True)
+    (root / 'dangling.iso').symlink_to(tmp_path / 'missing.iso')
+    return root
+
+
+def test_follow_symlinks_terminates_and_yields_each_file_once(linked_tree):
+    found = [item.path for item in discover_files([str(linked_tree)], use_external=False, follow_symlinks=True)]
+
+    contents = sorted(path.read_bytes() for path in found if path.exists())
+    assert contents == [b'far', b'one', b'three', b'top', b'two']
+    assert len(found) == len(set(found)) == 6  # plus the broken symlink, listed like a file
+    assert linked_tree / 'dangling.iso' in found
+
+
+def test_default_walk_matches_os_walk(linked_tree):
+    expected = [Path(root) / name for root, _dirs, files in os.walk(linked_tree) for name in files]
+
+    walked = [path for path, _entry in _walk_python(linked_tree)]
+
+    assert walked == expected
+    # Symlinked directories are listed by os.walk but never descended.
+    assert linked_tree / 'dangling.iso' in walked
+    assert not any('far.iso' in str(path) or 'again' in path.parts for path in walked)
@@ -0,0 +1,76 @@
+"""Tests for the in-kernel local copy used by the ``cp`` transfer tool."""
+
+from __future__ import annotations
+
+import os
+import shutil
+
+import pytest
+
+from fileops_toolkit.transfer import engine
+from fileops_toolkit.transfer.engine import _local_copy
+
+MTIME_NS = 1_600_000_000_123_456_789
+
+
+def _source(tmp_path, data: bytes = b'payload' * 1000):
+    src = tmp_path / 'src.bin'
+    src.write_bytes(data)
+    os.utime(src, ns=(MTIME_NS, MTIME_NS))
+    return src
+
+
+def test_copy_preserves_content_and_mtime(tmp_path):
+    src = _source(tmp_path)
+    dst = tmp_path / 'dst.bin'
+
+    _local_copy(src, dst)
+
+    assert dst.read_bytes() == src.read_bytes()
+    assert dst.stat().st_mtime_ns == src.stat().st_mtime_ns
+
+
+def test_copy_onto_itself_is_refused(tmp_path):
+    src = _source(tmp_path)
+    data = src.read_bytes()
+
+    with pytest.raises(shutil.SameFileError):
+        _local_copy(src, src)
+
+    assert src.read_bytes() == data
+
+
+def test_copy_onto_hard_link_is_refused(tmp_path):
+    src = _source(tmp_path)
+    data = src.read_bytes()
+    link = tmp_path / 'link.bin'
+    os.link(src, link)
+
+    with pytest.raises(shutil.SameFileError):
+        _local_copy(src, link)
+
+    assert src.read_bytes() == data
+
+
+def test_falls_back_to_copyfileobj_when_copy_file_range_fails(tmp_path, monkeypatch):
+    src = _source(tmp_path, os.urandom(3 * engine.COPY_CHUNK_SIZE + 17))
+    dst = tmp_path / 'dst.bin'
+
+    def refuse(*args, **kwargs):
+        raise OSError('EXDEV')
+
+    calls = []
+    real_copyfileobj = shutil.copyfileobj
+
+    def copyfileobj(*args, **kwargs):
+        calls.append(kwargs.get('length'))
+        return real_copyfileobj(*args, **kwargs)
+
+    monkeypatch.setattr(os, 'copy_file_range', refuse, raising=False)
+    monkeypatch.setattr(shutil, 'copyfileobj', copyfileobj)
+
+    _local_copy(src, dst)
+
+    assert calls == [engine.COPY_CHUNK_SIZE]
+    assert dst.read_bytes() == src.read_bytes()
+    assert dst.stat().st_mtime_ns == MTIME_NS
@@ -0,0 +1,46 @@
+"""Tests for operation logging."""
+
+from __future__ import annotations
+
+import csv
+import json
+from pathlib import Path
+
+from fileops_toolkit.deduplication.engine import Decision, DedupResult
+from fileops_toolkit.logging.logger import log_operation, setup_loggers
+from fileops_toolkit.metadata.scanner import FileMetadata
+
+
+def _planner_row(tmp_path: Path, message: str) -> None:
+    loggers = setup_loggers({'dir': str(tmp_path)}, 'run')
+    result = DedupResult(
+        src=FileMetadata(path=tmp_path / 'dup.iso', size_bytes=1, mtime=0.0),
+        dest_path=tmp_path / 'dest' / 'dup.iso',
+        decision=Decision.DUPLICATE,
+        reason='older',
+        message=message,
+        duplicate_action='delete',
+    )
+    try:
+        log_operation(
+            loggers, run_id='run', worker='planner', result=result, transfer=None, verified=None, preferred_algos=()
+        )
+    finally:
+        loggers.close()
+
+
+def test_failed_duplicate_action_is_an_error(tmp_path):
+    _planner_row(tmp_path, 'duplicate_action_failed:permission denied')
+
+    [row] = csv.DictReader((tmp_path / 'operations.csv').open())
+    assert row['error_msg'] == 'duplicate_action_failed:permission denied'
+    [entry] = [json.loads(line) for line in (tmp_path / 'errors.log').read_text().splitlines()]
+    assert entry['src_path'] == str(tmp_path / 'dup.iso')
+
+
+def test_successful_duplicate_action_is_not_an_error(tmp_path):
+    _planner_row(tmp_path, 'duplicate_deleted')
+
+    [row] = csv.DictReader((tmp_path / 'operations.csv').open())
+    assert row['error_msg'] == ''
+    assert not (tmp_path / 'errors.log').exists()
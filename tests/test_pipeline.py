@@ -0,0 +1,84 @@
+"""Tests for streaming metadata collection in the pipeline."""
+
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from fileops_toolkit import pipeline
+from fileops_toolkit.discovery.engine import DiscoveredFile
+from fileops_toolkit.pipeline import stream_metadata
+
+
+def _discovered(tmp_path: Path, count: int):
+    for i in range(count):
+        path = tmp_path / f'f{i:03d}.bin'
+        path.write_bytes(bytes([i % 256]) * (i + 1))
+        yield DiscoveredFile(path=path, root=tmp_path, relative_path=Path(path.name))
+
+
+def _discovery_threads():
+    return [t for t in threading.enumerate() if t.name == 'fileops-discovery']
+
+
+def test_results_keep_discovery_order(tmp_path, monkeypatch):
+    real = pipeline.get_file_metadata
+
+    def slow_for_early_files(path, *args, **kwargs):
+        # Earlier files finish last, so completion order is the reverse of discovery order.
+        time.sleep(max(0, 40 - int(path.stem[1:])) / 2000)
+        return real(path, *args, **kwargs)
+
+    monkeypatch.setattr(pipeline, 'get_file_metadata', slow_for_early_files)
+    items = list(_discovered(tmp_path, 40))
+
+    metas = list(stream_metadata(iter(items), 'md5', workers=8, queue_size=16))
+
+    assert [m.path for m in metas] == [item.path for item in items]
+    assert all(m.checksums['md5'] for m in metas)
+    assert not _discovery_threads()
+
+
+def test_discovery_error_reaches_caller(tmp_path):
+    def discovered():
+        yield from _discovered(tmp_path, 3)
+        raise PermissionError('walk failed')
+
+    with pytest.raises(PermissionError, match='walk failed'):
+        list(stream_metadata(discovered(), workers=2))
+    assert not _discovery_threads()
+
+
+def test_metadata_error_reaches_caller(tmp_path, monkeypatch):
+    real = pipeline.get_file_metadata
+
+    def failing(path, *args, **kwargs):
+        if path.name == 'f002.bin':
+            raise OSError('read failed')
+        return real(path, *args, **kwargs)
+
+    monkeypatch.setattr(pipeline, 'get_file_metadata', failing)
+
+    with pytest.raises(OSError, match='read failed'):
+        list(stream_metadata(_discovered(tmp_path, 10), workers=4))
+    assert not _discovery_threads()
+
+
+def test_close_stops_an_endless_producer(tmp_path):
+    (tmp_path / 'f.bin').write_bytes(b'x')
+    item = DiscoveredFile(path=tmp_path / 'f.bin', root=tmp_path, relative_path=Path('f.bin'))
+
+    stream = stream_metadata(itertools.repeat(item), workers=2, queue_size=4)
+    assert next(stream).path == item.path
+    assert next(stream).path == item.path
+
+    closer = threading.Thread(target=stream.close)
+    closer.start()
+    closer.join(timeout=5)
+
+    assert not closer.is_alive()
+    assert not _discovery_threads()
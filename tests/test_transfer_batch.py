@@ -0,0 +1,117 @@
+"""Tests for batched rsync transfers, run against a stub ``rsync`` on PATH."""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from fileops_toolkit.transfer.engine import DEFAULT_RSYNC_ARGS, transfer_files
+
+# Logs each call as one JSON line, then copies like rsync would. Batch runs
+# whose source directory is named ``fail`` exit non-zero without copying.
+STUB_RSYNC = '''#!{python}
+import json, shutil, sys
+from pathlib import Path
+
+argv = sys.argv[1:]
+batch = '--files-from=-' in argv
+stdin = sys.stdin.buffer.read() if batch else b''
+with open({log!r}, 'a') as fh:
+    fh.write(json.dumps({{'argv': argv, 'stdin': stdin.decode('latin-1')}}) + '\\n')
+src, dst = argv[-2], argv[-1]
+if batch:
+    if Path(src).name == 'fail':
+        sys.exit(23)
+    for name in stdin.split(b'\\0'):
+        shutil.copy2(Path(src) / name.decode(), Path(dst) / name.decode())
+else:
+    shutil.copy2(src, dst)
+'''
+
+
+@pytest.fixture
+def rsync_calls(tmp_path, monkeypatch):
+    bin_dir = tmp_path / 'bin'
+    bin_dir.mkdir()
+    log = tmp_path / 'rsync.log'
+    stub = bin_dir / 'rsync'
+    stub.write_text(STUB_RSYNC.format(python=sys.executable, log=str(log)))
+    stub.chmod(0o755)
+    monkeypatch.setenv('PATH', f'{bin_dir}:' + str(Path(sys.executable).parent))
+
+    def calls():
+        if not log.exists():
+            return []
+        return [json.loads(line) for line in log.read_text().splitlines()]
+
+    return calls
+
+
+def _make(path: Path, data: bytes) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return path
+
+
+def test_groups_pairs_by_directory_and_feeds_names_on_stdin(tmp_path, rsync_calls):
+    src_a, src_b = tmp_path / 'src' / 'a', tmp_path / 'src' / 'b'
+    dest = tmp_path / 'dest'
+    pairs = [
+        (_make(src_a / 'one.iso', b'1'), dest / 'one.iso'),
+        (_make(src_b / 'two.iso', b'2'), dest / 'two.iso'),
+        (_make(src_a / 'three.iso', b'3'), dest / 'three.iso'),
+    ]
+
+    outcomes = transfer_files(pairs, backoff_seconds=0)
+
+    calls = rsync_calls()
+    assert len(calls) == 2
+    by_src = {call['argv'][-2]: call for call in calls}
+    batch_a = by_src[f'{src_a}/']
+    assert batch_a['argv'] == [*DEFAULT_RSYNC_ARGS, '--from0', '--files-from=-', f'{src_a}/', f'{dest}/']
+    assert batch_a['stdin'] == 'one.iso\0three.iso'
+    assert by_src[f'{src_b}/']['stdin'] == 'two.iso'
+
+    assert [(o.src, o.dst) for o in outcomes] == pairs
+    assert all(o.success and o.tool == 'rsync' and o.exit_code == 0 for o in outcomes)
+    for src, dst in pairs:
+        assert dst.read_bytes() == src.read_bytes()
+
+
+def test_renamed_pairs_and_failed_groups_fall_back_per_file(tmp_path, rsync_calls):
+    src = tmp_path / 'src'
+    dest = tmp_path / 'dest'
+    dest.mkdir()
+    pairs = [
+        (_make(src / 'fail' / 'x.iso', b'x'), dest / 'x.iso'),
+        (_make(src / 'ok' / 'y.iso', b'y'), dest / 'y_1.iso'),
+        (_make(src / 'ok' / 'z.iso', b'z'), dest / 'z.iso'),
+        (_make(src / 'fail' / 'w.iso', b'w'), dest / 'w.iso'),
+    ]
+
+    outcomes = transfer_files(pairs, backoff_seconds=0)
+
+    calls = rsync_calls()
+    batches = [call for call in calls if '--files-from=-' in call['argv']]
+    singles = [call['argv'][-2:] for call in calls if '--files-from=-' not in call['argv']]
+    assert sorted(call['stdin'] for call in batches) == ['x.iso\0w.iso', 'z.iso']
+    # The renamed pair never joins a batch; the failed group is retried file by file.
+    assert sorted(singles) == sorted([[str(s), str(d)] for s, d in (pairs[0], pairs[1], pairs[3])])
+
+    assert [(o.src, o.dst) for o in outcomes] == pairs
+    assert all(o.success for o in outcomes)
+    assert (dest / 'y_1.iso').read_bytes() == b'y'
+    assert (dest / 'w.iso').read_bytes() == b'w'
+
+
+def test_dry_run_skips_batching(tmp_path, rsync_calls):
+    pairs = [(_make(tmp_path / 'src' / 'a.iso', b'a'), tmp_path / 'dest' / 'a.iso')]
+
+    outcomes = transfer_files(pairs, dry_run=True)
+
+    assert rsync_calls() == []
+    assert [(o.src, o.dst) for o in outcomes] == pairs
+    assert not pairs[0][1].exists()